@@ -0,0 +1,34 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Path, Query
+from app.redis_client import get_async_redis_client
+from app.utils.cache import CACHE_NAMESPACES
+
+from app.schemas.api_response import ApiResponse
+
+router = APIRouter()
+
+@router.delete("/cache/{namespace}")
+async def invalidate_cache(
+    namespace: str = Path(..., description=f"캐시 네임스페이스 ({', '.join(CACHE_NAMESPACES)})"),
+    key: Optional[str] = Query(None, description="네임스페이스 하위 키 (예: reviews의 place_id). 생략 시 네임스페이스 전체"),
+):
+    """
+    네임스페이스 단위 캐시 무효화 (SCAN + UNLINK, Redis 블로킹 없음)
+    
+    예: DELETE /cache/reviews?key=1997987484 → 해당 place_id의 리뷰 페이지 캐시 전체 삭제
+    
+    return :
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {"namespace": "reviews", "key": "1997987484", "deleted": 3},
+        "error": null
+    }
+    """
+    if namespace not in CACHE_NAMESPACES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 네임스페이스입니다: {namespace}")
+    
+    redis_client = await get_async_redis_client()
+    parts = (key,) if key else ()
+    deleted = await redis_client.invalidate_namespace(namespace, *parts)
+    return ApiResponse(data={"namespace": namespace, "key": key, "deleted": deleted})
@@ -0,0 +1,98 @@
+from fastapi import APIRouter, Query
+from app.redis_client import MEMORY_USAGE_MAX_KEYS, get_async_redis_client
+from app.services.crawl_controller import crawl_controller
+from app.services.local_search_service import get_quota_status
+
+from app.schemas.api_response import ApiResponse
+
+router = APIRouter()
+
+@router.get("/metrics/openapi-quota")
+async def get_openapi_quota():
+    """
+    return : Open API 키 세트별 남은 토큰 및 일일 호출량
+    {
+        "status": 200,
+        "message": "Success",
+        "data": [
+            {
+                "client_id": "abcd***",
+                "available_tokens": 9.5,
+                "capacity": 10,
+                "rate_per_sec": 10.0,
+                "daily_quota": 25000,
+                "daily_used": 120,
+                "daily_remaining": 24880,
+                "redis_available": true
+            }
+        ],
+        "error": null
+    }
+    """
+    return ApiResponse(data=await get_quota_status())
+
+
+@router.get("/metrics/crawl-controller")
+async def get_crawl_controller_status():
+    """
+    return : 크롤링 동시성 제어 상태 (레플리카 공유, Redis 장애 시 기본값)
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "limit": 4.0,
+            "running": 2,
+            "block_streak": 0,
+            "backoff_level": 0,
+            "circuit_open": false,
+            "circuit_open_seconds": 0,
+            "redis_available": true
+        },
+        "error": null
+    }
+    """
+    return ApiResponse(data=await crawl_controller.status())
+
+
+@router.get("/metrics/redis-near-cache")
+async def get_redis_near_cache_stats():
+    """
+    return : 현재 워커의 Redis 니어 캐시 적중률 및 메모리 사용량 (비활성화 시 data는 null)
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "entries": 120,
+            "max_entries": 10000,
+            "approx_bytes": 48213,
+            "hits": 950,
+            "misses": 130,
+            "hit_ratio": 0.8796,
+            "evictions": 0,
+            "invalidations": 4
+        },
+        "error": null
+    }
+    """
+    redis_client = await get_async_redis_client()
+    return ApiResponse(data=redis_client.near_cache_stats())
+
+
+@router.get("/metrics/redis-memory")
+async def get_redis_memory_by_namespace(
+    max_keys: int = Query(MEMORY_USAGE_MAX_KEYS, ge=1, le=1_000_000, description="표본 집계할 최대 키 수"),
+):
+    """
+    return : 네임스페이스별 키 수 및 메모리 사용량 (SCAN 기반, 최대 max_keys개 표본)
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "reviews": {"keys": 320, "bytes": 1523400},
+            "report": {"keys": 40, "bytes": 210330}
+        },
+        "error": null
+    }
+    """
+    redis_client = await get_async_redis_client()
+    return ApiResponse(data=await redis_client.memory_usage_by_namespace(max_keys=max_keys))
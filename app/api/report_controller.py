@@ -0,0 +1,53 @@
+from typing import Optional
+from fastapi import APIRouter, Path, Query
+from app.application.report_application_service import ReportApplicationService
+
+from app.schemas.api_response import ApiResponse
+
+router = APIRouter()
+
+@router.get("/reports/latest")
+async def get_latest_report(
+    store_id: Optional[int] = Query(None, description="매장 ID"),
+    name: Optional[str] = Query(None, description="상호명 (store_id 미지정 시 사용)"),
+    include_details: bool = Query(False, description="True 시 키워드 목록, 분석 결과(JSON) 포함"),
+):
+    """
+    return : 매장의 최신 보고서
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "report_id": 1,
+            "store_id": 1,
+            "request_member_id": 1,
+            "average_review_rate": 4.5,
+            "total_review_count": 120,
+            "created_at": "2025-07-15T12:00:00"
+        },
+        "error": null
+    }
+    """
+    service = ReportApplicationService()
+    report = await service.get_latest_report(store_id, name, include_details)
+    return ApiResponse(data=report)
+
+
+@router.delete("/reports/{store_id}/cache")
+async def invalidate_latest_report_cache(
+    store_id: int = Path(..., description="매장 ID"),
+):
+    """
+    최신 보고서 캐시 무효화 (보고서를 저장한 쪽에서 저장 직후 호출)
+
+    return :
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {"store_id": 1, "deleted": 2},
+        "error": null
+    }
+    """
+    service = ReportApplicationService()
+    deleted = await service.invalidate_latest_report(store_id)
+    return ApiResponse(data={"store_id": store_id, "deleted": deleted})
@@ -1,8 +1,10 @@
+from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
 import asyncio
 
-from app.services.reviews_service import reviews_fetch, reviews_parser
-from app.schemas.review import ReviewsResponse
+from app.application.review_application_service import ReviewApplicationService
+from app.services.reviews_service import reviews_fetch
+from app.schemas.review import ReviewsResponse, StoredReviewsResponse
 
 router = APIRouter()
 
@@ -18,18 +20,18 @@ async def get_reviews(
         print_all: bool = Query(False, description="디버그용 출력 불리언. True 시 전체 리뷰 HTML 출력")
         # sort: str = Query("recent", description="정렬 기준 (예: recent 또는 popular)")
 ):
-    html = await asyncio.get_event_loop().run_in_executor(
-        None, reviews_fetch, place_id, more_reviews
-    )
-
     # 디버그용. True 시 리뷰 태그 전체 출력
     if print_all:
+        html = await asyncio.get_event_loop().run_in_executor(
+            None, reviews_fetch, place_id, more_reviews
+        )
         start = html.find('<li class="place_apply_pui')
         end = html.find("</li>", start) + len("</li>")
         snippet = html[start:end] if start != -1 and end != -1 else html[:200000]
         return {"place_id": place_id, "review_count": 0, "reviews": [], "html_snippet": snippet}
 
-    reviews = reviews_parser(html)
+    # 동시성 제어(AIMD) 및 차단 감지를 거쳐 크롤링
+    reviews = await ReviewApplicationService().crawl_reviews(place_id, more_reviews)
     if not reviews:
         raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없습니다.")
 
@@ -38,3 +40,20 @@ async def get_reviews(
         review_count=len(reviews),
         reviews=reviews
     )
+
+
+@router.get(
+    "/reviews/stored",
+    summary="저장된 네이버플레이스 리뷰 조회 (커서 페이지네이션)",
+    response_model=StoredReviewsResponse,
+)
+async def get_stored_reviews(
+        place_id: str = Query(..., description="네이버플레이스 ID (예: 1997987484)"),
+        size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
+        revisit_only: bool = Query(False, description="True 시 재방문 리뷰만 조회")
+):
+    # 저장된 데이터가 없거나 오래된 경우에만 첫 페이지 요청에서 크롤링
+    service = ReviewApplicationService()
+    page = await service.get_stored_reviews(place_id, size, cursor, revisit_only)
+    return StoredReviewsResponse(**page)
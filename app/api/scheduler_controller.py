@@ -0,0 +1,71 @@
+from fastapi import APIRouter, HTTPException, Path, Query
+from app.application.recrawl_scheduler import recrawl_scheduler
+
+from app.schemas.api_response import ApiResponse
+
+router = APIRouter()
+
+@router.get("/scheduler/recrawl")
+async def get_recrawl_status(
+    preview: int = Query(10, ge=0, le=100, description="우선순위 대기열 미리보기 개수"),
+):
+    """
+    return : 주기적 재수집 스케줄러 상태 및 우선순위 대기열
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "running": true,
+            "paused": false,
+            "is_leader": true,
+            "hourly_budget": 60,
+            "budget_used": 12,
+            "tracked_stores": 85,
+            "due_stores": 7,
+            "backed_off_stores": 1,
+            "inflight": [3],
+            "queue": [
+                {
+                    "store_id": 12,
+                    "name": "가게명",
+                    "place_id": "1997987484",
+                    "review_velocity": 1.8,
+                    "expected_new_reviews": 3.6,
+                    "overdue": false,
+                    "last_crawled_at": "2024-07-15T10:00:00"
+                }
+            ]
+        },
+        "error": null
+    }
+    """
+    return ApiResponse(data=await recrawl_scheduler.status(preview))
+
+
+@router.post("/scheduler/recrawl/pause")
+async def pause_recrawl():
+    """재수집 일시 정지 (모든 레플리카 적용, 진행 중인 크롤링은 완료됨)"""
+    await recrawl_scheduler.pause()
+    return ApiResponse(data={"paused": True})
+
+
+@router.post("/scheduler/recrawl/resume")
+async def resume_recrawl():
+    """재수집 재개"""
+    await recrawl_scheduler.resume()
+    return ApiResponse(data={"paused": False})
+
+
+@router.put("/scheduler/recrawl/stores/{store_id}")
+async def set_recrawl_tracking(
+    store_id: int = Path(..., description="매장 ID"),
+    tracked: bool = Query(True, description="재수집 대상 여부"),
+):
+    """
+    매장 재수집 대상 등록/해제
+    
+    리뷰 분석을 요청한 매장은 자동으로 등록된다.
+    """
+    if not await recrawl_scheduler.set_tracking(store_id, tracked):
+        raise HTTPException(status_code=404, detail="PLACE ID가 등록된 매장을 찾을 수 없습니다.")
+    return ApiResponse(data={"store_id": store_id, "tracked": tracked})
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from app.application.review_application_service import ReviewApplicationService
-from app.config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+import json
+import logging
+import uuid
+from typing import Dict, List, Optional
 
-import httpx
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.application.review_application_service import ReviewApplicationService, analytics_channel
+from app.application.store_index import store_index
+from app.services.local_search_service import search_local, search_local_variants
+from app.services.store_index_service import store_key
 
+from app.schemas.analytics import BatchAnalyticsRequest
 from app.schemas.api_response import ApiResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 @router.get("/stores/search")
@@ -18,6 +27,7 @@ async def get_stores(
         pattern="^(random|comment)$",
         description="정렬 방식 (random 또는 comment)"
     ),
+    background_tasks: BackgroundTasks = BackgroundTasks()
 ):
     """
     return : 검색 쿼리 결과 값
@@ -33,19 +43,10 @@ async def get_stores(
         "error": null
     }
     """
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
-    }
-    params = {"query": keyword, "display": size, "start": page, "sort": sort}
-
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, headers=headers, params=params)
-    if resp.status_code != 200:
-        raise HTTPException(status_code=resp.status_code, detail=resp.text)
-
-    data = resp.json()
+    data = await search_local(keyword, size, page, sort)
+    items = data.get("items", [])
+    store_index.add_search_items(items)
+    background_tasks.add_task(store_index.persist_search_items, items)
     
     stores = [
         {"name": item["title"]}
@@ -53,6 +54,137 @@ async def get_stores(
     ]
     
     return ApiResponse(data=stores)
+
+
+@router.get("/stores/search/deep")
+async def deep_search_stores(
+    keyword: str = Query(..., description="검색할 키워드 (예: '정자동 카페')"),
+    size: int = Query(50, ge=1, le=100, description="결과 최대 개수 (5건 단위로 동시 요청, 중복 제거 후 더 적을 수 있음, 검색어 접미어 미설정 시 최대 10건)"),
+    sort: str = Query(
+        "random",
+        pattern="^(random|comment)$",
+        description="정렬 방식 (random 또는 comment)"
+    ),
+    background_tasks: BackgroundTasks = BackgroundTasks()
+):
+    """
+    5건 제한을 넘는 지역 검색
+    
+    지역 검색 API는 start 1 / display 5만 허용하므로 정렬 방식과 검색어 변형(키워드 + 접미어, LOCAL_SEARCH_QUERY_SUFFIXES 설정 시)을 바꿔 가며
+    Open API 호출 한도 내에서 동시에 요청하고, 상호명 + 도로명 주소 기준으로 중복을 제거하여
+    결과가 도착하는 순서대로 NDJSON(application/x-ndjson)으로 스트리밍한다.
+    
+    return : 한 줄에 하나의 JSON
+    {"type": "items", "query": "정자동 카페", "sort": "comment", "items": [{"title": "...", "roadAddress": "...", "mapx": "...", ...}]}
+    {"type": "error", "query": "정자동 카페", "sort": "random", "status": 429, "detail": "..."}
+    {"type": "done", "count": 47, "failed_pages": 1}
+    """
+    collected: List[Dict] = []
+    
+    async def stream():
+        seen = set()
+        failed_pages = 0
+        async for variant, result in search_local_variants(keyword, size, sort):
+            if isinstance(result, HTTPException):
+                failed_pages += 1
+                yield json.dumps(
+                    {"type": "error", **variant, "status": result.status_code, "detail": result.detail},
+                    ensure_ascii=False,
+                ) + "\n"
+                continue
+            
+            items = []
+            for item in result.get("items", []):
+                key = store_key(item.get("title", ""), item.get("roadAddress"))
+                if key not in seen:
+                    seen.add(key)
+                    items.append(item)
+            if not items:
+                continue
+            store_index.add_search_items(items)
+            collected.extend(items)
+            yield json.dumps({"type": "items", **variant, "items": items}, ensure_ascii=False) + "\n"
+        
+        yield json.dumps({"type": "done", "count": len(collected), "failed_pages": failed_pages}) + "\n"
+    
+    # 스트리밍이 끝난 뒤 실행되므로 그때까지 모인 매장을 저장
+    background_tasks.add_task(store_index.persist_search_items, collected)
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.get("/stores/nearby")
+async def get_nearby_stores(
+    x: float = Query(..., ge=-180, le=180, description="중심 경도 (WGS84)"),
+    y: float = Query(..., ge=-90, le=90, description="중심 위도 (WGS84)"),
+    radius: int = Query(500, ge=1, le=20000, description="반경 (m)"),
+    category: Optional[str] = Query(None, description="카테고리 부분 일치 (예: '카페')"),
+    size: int = Query(10, ge=1, le=50, description="결과 최대 개수"),
+    keyword: Optional[str] = Query(None, description="인덱스 결과가 부족할 때 지역 검색에 사용할 키워드 (예: '정자동 카페')"),
+    background_tasks: BackgroundTasks = BackgroundTasks()
+):
+    """
+    주변 매장 검색
+    
+    알려진 매장의 메모리 공간 인덱스에서 먼저 찾고, 결과가 size보다 적으면서 keyword가 있을 때만
+    지역 검색 Open API를 호출하여 결과를 인덱스에 추가한 뒤 다시 찾는다.
+    
+    return : 가까운 순 매장 목록 (distance: m, source: index 또는 openapi)
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "source": "index",
+            "stores": [
+                {
+                    "store_id": 12,
+                    "place_id": "1997987484",
+                    "name": "스타벅스 정자점",
+                    "address": "경기도 성남시 분당구 정자일로 121",
+                    "category": "카페,디저트>카페",
+                    "mapx": 1271083434,
+                    "mapy": 373668542,
+                    "distance": 120.5
+                }
+            ]
+        },
+        "error": null
+    }
+    """
+    stores = store_index.nearby(x, y, radius, category, size)
+    if len(stores) >= size or not keyword:
+        return ApiResponse(data={"source": "index", "stores": stores})
+    
+    try:
+        data = await search_local(keyword, 5, 1, "random")
+    except HTTPException as e:
+        # Open API 한도 초과 등으로 실패하면 인덱스 결과라도 반환
+        if not stores:
+            raise
+        logger.warning(f"주변 매장 보강 검색 실패, 인덱스 결과 반환 - keyword: {keyword}, error: {e.detail}")
+        return ApiResponse(data={"source": "index", "stores": stores})
+    
+    items = data.get("items", [])
+    store_index.add_search_items(items)
+    background_tasks.add_task(store_index.persist_search_items, items)
+    return ApiResponse(data={"source": "openapi", "stores": store_index.nearby(x, y, radius, category, size)})
+
+
+@router.get("/stores/within")
+async def get_stores_within(
+    min_x: float = Query(..., ge=-180, le=180, description="최소 경도"),
+    min_y: float = Query(..., ge=-90, le=90, description="최소 위도"),
+    max_x: float = Query(..., ge=-180, le=180, description="최대 경도"),
+    max_y: float = Query(..., ge=-90, le=90, description="최대 위도"),
+    category: Optional[str] = Query(None, description="카테고리 부분 일치 (예: '카페')"),
+    size: int = Query(100, ge=1, le=1000, description="결과 최대 개수"),
+):
+    """
+    return : 지도 영역(경위도 사각형) 내 알려진 매장 목록 (공간 인덱스 조회, Open API 호출 없음)
+    """
+    if min_x > max_x or min_y > max_y:
+        raise HTTPException(status_code=400, detail="영역 최솟값이 최댓값보다 큽니다.")
+    return ApiResponse(data=store_index.within(min_x, min_y, max_x, max_y, category, size))
+
     
 @router.get("/stores/analytics")
 async def get_store_analytics(
@@ -77,4 +209,40 @@ async def get_store_analytics(
         name
     )
     
-    return ApiResponse()
\ No newline at end of file
+    return ApiResponse()
+
+
+@router.post("/stores/analytics/batch")
+async def create_batch_store_analytics(
+    request: BatchAnalyticsRequest,
+    background_tasks: BackgroundTasks = BackgroundTasks()
+):
+    """
+    여러 상호명을 한 번에 분석 요청
+    
+    PLACE ID 조회와 리뷰 크롤링을 공유 동시성 한도 내에서 병렬로 실행하며,
+    같은 PLACE ID로 해석되는 상호명은 한 번만 크롤링한다.
+    
+    return : 배치 ID와 이벤트 채널. 매장별 완료 이벤트(STORE_ANALYTICS_COMPLETED / STORE_ANALYTICS_FAILED)와
+    최종 집계 이벤트(BATCH_ANALYTICS_COMPLETED)는 해당 채널로 발행된다.
+    {
+        "status": 200,
+        "message": "Success",
+        "data": {
+            "batch_id": "3f1c...",
+            "channel": "analytics:3f1c..."
+        },
+        "error": null
+    }
+    """
+    service = ReviewApplicationService()
+    batch_id = uuid.uuid4().hex
+    
+    background_tasks.add_task(
+        service.execute_batch,
+        batch_id,
+        request.names,
+        request.more_reviews
+    )
+    
+    return ApiResponse(data={"batch_id": batch_id, "channel": analytics_channel(batch_id)})
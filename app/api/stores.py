@@ -1,7 +1,7 @@
 from typing import Union
-from fastapi import APIRouter, HTTPException, Query
-import httpx
-from app.config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from fastapi import APIRouter, BackgroundTasks, Query
+from app.application.store_index import store_index
+from app.services.local_search_service import search_local
 from app.schemas.store import StoreSearchResponse, SimpleStoreResponse
 
 router = APIRouter()
@@ -21,20 +21,12 @@ async def get_stores(
         description="정렬 방식 (random 또는 comment)"
     ),
     simple: bool = Query(False, description="상호명, 위도, 경도만 반환"),
+    background_tasks: BackgroundTasks = BackgroundTasks(),
 ):
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
-    }
-    params = {"query": query, "display": display, "start": start, "sort": sort}
-
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(url, headers=headers, params=params)
-    if resp.status_code != 200:
-        raise HTTPException(status_code=resp.status_code, detail=resp.text)
-
-    data = resp.json()
+    data = await search_local(query, display, start, sort)
+    # 검색 결과 좌표를 주변 매장 검색용 공간 인덱스에 반영
+    store_index.add_search_items(data.get("items", []))
+    background_tasks.add_task(store_index.persist_search_items, data.get("items", []))
 
     # Simple Response 활성화 시
     if simple:
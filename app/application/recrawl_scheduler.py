@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from redis.exceptions import RedisError
+
+from app.config import (
+    RECRAWL_HOURLY_BUDGET,
+    RECRAWL_TICK_SECONDS,
+    RECRAWL_JITTER_SECONDS,
+    RECRAWL_MIN_INTERVAL_HOURS,
+    RECRAWL_MAX_INTERVAL_HOURS,
+)
+from app.database import Session
+from app.models.models import Store
+from app.redis_client import get_async_redis_client
+from app.application.review_application_service import ReviewApplicationService
+from app.services.recrawl_service import expected_new_reviews, is_overdue, select_due_stores
+from app.services.review_db_service import list_tracked_stores, set_store_tracking
+
+logger = logging.getLogger(__name__)
+
+_PAUSED_KEY = "recrawl:paused"
+_LEADER_KEY = "recrawl:leader"
+# 실패한 매장의 재시도 가능 시각 (score = epoch 초) / 연속 실패 횟수
+_BACKOFF_KEY = "recrawl:backoff"
+_FAILURES_KEY = "recrawl:failures"
+# 리더가 죽으면 틱 몇 번 안에 다른 레플리카가 이어받음
+_LEADER_LEASE = RECRAWL_TICK_SECONDS * 3 + RECRAWL_JITTER_SECONDS
+
+# 토큰이 일치하면 임대 연장, 비어 있으면 획득
+_LEADER_SCRIPT = """
+local owner = redis.call('GET', KEYS[1])
+if owner == ARGV[1] then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+if not owner then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _budget_key(now: datetime) -> str:
+    return f"recrawl:budget:{now.strftime('%Y%m%d%H')}"
+
+
+def failure_backoff_seconds(failures: int) -> float:
+    """연속 실패 횟수별 재시도 대기 (최소 간격부터 2배씩, 최대 간격까지)"""
+    hours = min(RECRAWL_MAX_INTERVAL_HOURS, RECRAWL_MIN_INTERVAL_HOURS * 2 ** (failures - 1))
+    return hours * 3600
+
+
+class RecrawlScheduler:
+    """
+    추적 매장(Store.is_tracked) 리뷰 주기적 재수집 스케줄러
+
+    틱마다 예상 신규 리뷰 수가 큰 매장부터 ReviewApplicationService.refresh_reviews로
+    재수집한다 (single-flight / AIMD 슬롯 등 일반 크롤링 경로를 그대로 사용).
+    - 시간당 전역 예산(RECRAWL_HOURLY_BUDGET)을 Redis 카운터로 레플리카 간 공유하고,
+      한 틱에는 예산의 틱 비율만큼만 사용해 한 시간에 고르게 분산한다.
+    - 틱 간격과 각 크롤링 시작 시각에 지터를 준다.
+    - Redis 리더 락을 잡은 레플리카 하나만 스케줄링한다.
+    - 일시 정지 플래그는 Redis에 저장되어 모든 레플리카에 적용된다.
+    - 재수집이 실패한 매장(차단, 서킷 오픈 등)은 last_crawled_at이 갱신되지 않으므로
+      연속 실패 횟수에 따라 지수적으로 대상에서 제외한다.
+    """
+
+    def __init__(self):
+        self._token = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+        # store_id -> 재수집 Task
+        self._inflight: Dict[int, asyncio.Task] = {}
+        self.is_leader = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info("재수집 스케줄러 시작")
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._task, *self._inflight.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        if self.is_leader:
+            redis_client = await get_async_redis_client()
+            await redis_client.eval_script(_RELEASE_SCRIPT, keys=[_LEADER_KEY], args=[self._token])
+            self.is_leader = False
+
+    async def pause(self) -> None:
+        redis_client = await get_async_redis_client()
+        await redis_client.set(_PAUSED_KEY, 1)
+
+    async def resume(self) -> None:
+        redis_client = await get_async_redis_client()
+        await redis_client.delete(_PAUSED_KEY)
+
+    async def is_paused(self) -> bool:
+        redis_client = await get_async_redis_client()
+        return await redis_client.exists(_PAUSED_KEY)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"재수집 스케줄링 실패 - error: {e}")
+            await asyncio.sleep(RECRAWL_TICK_SECONDS + random.uniform(0, RECRAWL_JITTER_SECONDS))
+
+    async def _hold_leadership(self) -> bool:
+        redis_client = await get_async_redis_client()
+        result = await redis_client.eval_script(
+            _LEADER_SCRIPT, keys=[_LEADER_KEY], args=[self._token, _LEADER_LEASE]
+        )
+        # Redis 장애 시에는 중복 실행보다 중단이 안전하므로 리더가 아닌 것으로 간주
+        self.is_leader = bool(result)
+        return self.is_leader
+
+    async def _reserve_budget(self, count: int, now: datetime) -> int:
+        """이번 시간 예산에서 최대 count건 예약. return : 예약된 건수"""
+        if count <= 0:
+            return 0
+        redis_client = await get_async_redis_client()
+        key = _budget_key(now)
+        used = await redis_client.incr(key, count)
+        if used == count:
+            await redis_client.expire(key, 2 * 60 * 60)
+        granted = max(0, min(count, RECRAWL_HOURLY_BUDGET - (used - count)))
+        if granted < count:
+            await redis_client.decr(key, count - granted)
+        return granted
+
+    async def tick(self) -> int:
+        """
+        재수집 대상 선정 및 실행 예약
+
+        return : 이번 틱에 시작한 재수집 수
+        """
+        if await self.is_paused() or not await self._hold_leadership():
+            return 0
+
+        now = datetime.now()
+        stores = await asyncio.get_event_loop().run_in_executor(None, self._load_tracked)
+        backoff = await self._backed_off_store_ids()
+        candidates = [
+            store for store in stores
+            if store.store_id not in self._inflight and store.store_id not in backoff
+        ]
+        per_tick = max(1, math.ceil(RECRAWL_HOURLY_BUDGET * RECRAWL_TICK_SECONDS / 3600))
+        due = select_due_stores(candidates, now, per_tick)
+
+        granted = await self._reserve_budget(len(due), now)
+        for store in due[:granted]:
+            task = asyncio.create_task(self._recrawl(store.store_id, store.place_id, store.name))
+            self._inflight[store.store_id] = task
+            task.add_done_callback(lambda _, store_id=store.store_id: self._inflight.pop(store_id, None))
+        return granted
+
+    async def _recrawl(self, store_id: int, place_id: str, store_name: str) -> None:
+        await asyncio.sleep(random.uniform(0, RECRAWL_JITTER_SECONDS))
+        try:
+            inserted = await ReviewApplicationService().refresh_reviews(place_id, store_name)
+        except Exception as e:
+            failures = await self._record_failure(store_id)
+            logger.warning(
+                f"재수집 실패 - store_id: {store_id}, place_id: {place_id}, 연속 실패: {failures}, error: {e}"
+            )
+            return
+        await self._clear_failures(store_id)
+        logger.info(f"재수집 완료 - store_id: {store_id}, place_id: {place_id}, 신규 리뷰: {inserted}")
+
+    async def _backed_off_store_ids(self) -> Set[int]:
+        redis_client = await get_async_redis_client()
+        try:
+            client = await redis_client.get_client()
+            members = await client.zrangebyscore(_BACKOFF_KEY, time.time(), "+inf")
+        except RedisError as e:
+            logger.warning(f"재수집 백오프 조회 실패 - error: {e}")
+            return set()
+        return {int(member) for member in members}
+
+    async def _record_failure(self, store_id: int) -> int:
+        redis_client = await get_async_redis_client()
+        try:
+            client = await redis_client.get_client()
+            failures = await client.hincrby(_FAILURES_KEY, store_id, 1)
+            await client.zadd(_BACKOFF_KEY, {store_id: time.time() + failure_backoff_seconds(failures)})
+        except RedisError as e:
+            logger.warning(f"재수집 실패 기록 실패 - store_id: {store_id}, error: {e}")
+            return 0
+        return failures
+
+    async def _clear_failures(self, store_id: int) -> None:
+        redis_client = await get_async_redis_client()
+        try:
+            client = await redis_client.get_client()
+            await client.hdel(_FAILURES_KEY, store_id)
+            await client.zrem(_BACKOFF_KEY, store_id)
+        except RedisError as e:
+            logger.warning(f"재수집 실패 기록 삭제 실패 - store_id: {store_id}, error: {e}")
+
+    def _load_tracked(self) -> List[Store]:
+        with Session() as session:
+            return list_tracked_stores(session)
+
+    def _set_tracking(self, store_id: int, tracked: bool) -> bool:
+        with Session() as session:
+            updated = set_store_tracking(session, store_id, tracked)
+            session.commit()
+        return updated
+
+    async def set_tracking(self, store_id: int, tracked: bool) -> bool:
+        """return : 대상 매장(PLACE ID 보유) 존재 여부"""
+        return await asyncio.get_event_loop().run_in_executor(None, self._set_tracking, store_id, tracked)
+
+    async def status(self, preview: int = 10) -> Dict:
+        redis_client = await get_async_redis_client()
+        now = datetime.now()
+        stores = await asyncio.get_event_loop().run_in_executor(None, self._load_tracked)
+        backoff = await self._backed_off_store_ids()
+        queue = select_due_stores([store for store in stores if store.store_id not in backoff], now)
+        return {
+            "running": self._task is not None,
+            "paused": await self.is_paused(),
+            "is_leader": self.is_leader,
+            "hourly_budget": RECRAWL_HOURLY_BUDGET,
+            "budget_used": int(await redis_client.get(_budget_key(now)) or 0),
+            "tracked_stores": len(stores),
+            "due_stores": len(queue),
+            "backed_off_stores": len(backoff),
+            "inflight": list(self._inflight),
+            "queue": [
+                {
+                    "store_id": store.store_id,
+                    "name": store.name,
+                    "place_id": store.place_id,
+                    "review_velocity": store.review_velocity,
+                    "expected_new_reviews": None if math.isinf(expected) else round(expected, 2),
+                    "overdue": is_overdue(store, now),
+                    "last_crawled_at": store.last_crawled_at.isoformat() if store.last_crawled_at else None,
+                }
+                for store in queue[:preview]
+                for expected in (expected_new_reviews(store, now),)
+            ],
+        }
+
+
+recrawl_scheduler = RecrawlScheduler()
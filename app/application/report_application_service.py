@@ -0,0 +1,88 @@
+import asyncio
+from typing import Dict, Optional
+
+from fastapi import HTTPException
+
+from app.config import REPORT_CACHE_TTL, REPORT_LATEST_CACHE_TTL
+from app.database import Session
+from app.redis_client import get_async_redis_client
+from app.services.report_service import (
+    report_to_dict,
+    get_latest_report,
+    find_store_id_by_name,
+)
+from app.utils.cache import REPORTS_NAMESPACE, build_cache_key
+
+
+def _latest_cache_key(store_id: int, include_details: bool) -> str:
+    return build_cache_key(REPORTS_NAMESPACE, store_id, "latest", "full" if include_details else "summary")
+
+
+class ReportApplicationService:
+
+    async def get_latest_report(
+        self,
+        store_id: Optional[int] = None,
+        name: Optional[str] = None,
+        include_details: bool = False,
+    ) -> Dict:
+        """
+        매장 ID 또는 상호명으로 최신 보고서 조회
+
+        1. 상호명 → 매장 ID (캐시)
+        2. Redis 최신 보고서 캐시 확인
+        3. 캐시 미스 시 DB 조회 후 짧은 TTL(REPORT_LATEST_CACHE_TTL)로 캐싱
+        """
+        if store_id is None and not name:
+            raise HTTPException(status_code=400, detail="store_id 또는 name이 필요합니다.")
+
+        redis_client = await get_async_redis_client()
+        loop = asyncio.get_event_loop()
+
+        # 1
+        if store_id is None:
+            name_key = build_cache_key(REPORTS_NAMESPACE, "name", name)
+            store_id = await redis_client.get(name_key)
+            if store_id is None:
+                store_id = await loop.run_in_executor(None, self._find_store_id, name)
+                if store_id is None:
+                    raise HTTPException(status_code=404, detail="매장을 찾을 수 없습니다.")
+                await redis_client.set(name_key, store_id, ex=REPORT_CACHE_TTL)
+
+        # 2
+        cache_key = _latest_cache_key(store_id, include_details)
+        cached = await redis_client.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 3
+        report = await loop.run_in_executor(None, self._load_latest, store_id, include_details)
+        if report is None:
+            raise HTTPException(status_code=404, detail="보고서를 찾을 수 없습니다.")
+
+        await redis_client.set(cache_key, report, ex=REPORT_LATEST_CACHE_TTL)
+        return report
+
+    async def invalidate_latest_report(self, store_id: int) -> int:
+        """
+        최신 보고서 캐시 무효화
+
+        보고서를 저장하는 곳(분석 워커 등)은 저장 후 이 메서드나
+        DELETE /api/v2/reports/{store_id}/cache를 호출해야 새 보고서가 바로 보인다.
+
+        return : 삭제된 키 수
+        """
+        redis_client = await get_async_redis_client()
+        return await redis_client.delete(
+            _latest_cache_key(store_id, True), _latest_cache_key(store_id, False)
+        )
+
+    def _find_store_id(self, name):
+        with Session() as session:
+            return find_store_id_by_name(session, name)
+
+    def _load_latest(self, store_id, include_details):
+        with Session() as session:
+            report = get_latest_report(session, store_id, include_details)
+            return report_to_dict(report, include_details) if report else None
+
@@ -1,9 +1,64 @@
 import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
 
+from app.config import (
+    REVIEW_STALE_MINUTES,
+    REVIEW_PAGE_CACHE_TTL,
+    CRAWL_MAX_CONCURRENCY,
+    CRAWL_TABS_PER_BROWSER,
+    CRAWL_LOCK_LEASE,
+    CRAWL_RESULT_TTL,
+    CRAWL_WAIT_TIMEOUT,
+    PLACE_ID_CACHE_TTL,
+    REVIEW_DEDUPE_ENABLED,
+)
+from app.database import Session
+from app.redis_client import get_async_redis_client
+from app.redis_pubsub_gateway import RedisPubSubGateway
+from app.schemas.message_types import EventType
+from app.services.crawl_controller import CrawlBlocked, CrawlOutcome, crawl_controller, classify_crawl_outcome
 from app.services.place_service import place_fetcher, place_parser
-from app.services.reviews_service import reviews_fetch, reviews_parser
+from app.services.review_dedupe_service import dedupe_reviews
+from app.services.reviews_service import reviews_fetch, reviews_fetch_many, reviews_parser
+from app.services.review_db_service import (
+    get_or_create_store,
+    get_store_by_place_id,
+    save_reviews,
+    is_stale,
+    fetch_stored_reviews,
+    update_review_velocity,
+)
+from app.utils.cache import REVIEWS_NAMESPACE, PLACE_ID_NAMESPACE, build_cache_key, build_key_index
+from app.utils.single_flight import RedisSingleFlight
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 전체에서 공유하는 브라우저(크롤링) 동시 실행 한도
+_crawl_semaphore = asyncio.Semaphore(CRAWL_MAX_CONCURRENCY)
+
+# 같은 place_id 리뷰 크롤링은 레플리카 전체에서 한 번만 실행
+_review_single_flight = RedisSingleFlight(
+    "crawl:reviews",
+    lease=CRAWL_LOCK_LEASE,
+    result_ttl=CRAWL_RESULT_TTL,
+    wait_timeout=CRAWL_WAIT_TIMEOUT,
+)
+
+
+def crawl_key(place_id: str, more_reviews: int) -> str:
+    """
+    single-flight 키: 더보기 횟수가 다른 요청은 결과 리뷰 수가 다르므로 따로 크롤링
+    """
+    return f"{place_id}:{more_reviews}"
+
+
+def analytics_channel(batch_id: str) -> str:
+    """배치 분석 이벤트 발행 채널"""
+    return f"analytics:{batch_id}"
 
 
 class ReviewApplicationService:
@@ -22,25 +77,355 @@ class ReviewApplicationService:
         """
         
         # 1
-        html = await asyncio.get_event_loop().run_in_executor(
-            None, place_fetcher, store_name, False
-        )
-        # 추출된 place id
-        place_id = place_parser(html)
+        place_id = await self.resolve_place_id(store_name)
         
         # 2
         more_reviews = 5 # 더보기 클릭 횟수
-        html = await asyncio.get_event_loop().run_in_executor(
-            None, reviews_fetch, place_id, more_reviews
-        )
-        
-        reviews = reviews_parser(html)
+        reviews = await self.crawl_reviews(place_id, more_reviews)
         if not reviews:
             raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없습니다.")
         
         # 3 리뷰 분석 로직 추가
+        # 분석 로직이 들어오면 입력은 filter_duplicate_reviews(reviews)로 유사 중복/템플릿 리뷰를 제외
+        # (execute_batch의 analyze도 동일하게 적용)
+        # (DB에는 원본 그대로 저장)
     
         # 4 DB 저장
+        await self.persist_reviews(store_name, place_id, reviews, track=True)
         
         # 5 return -> redis event를 통해 웹소켓 서버에 이벤트 발행 후 유저에게 전달
-        
\ No newline at end of file
+        
+    async def execute_batch(self, batch_id: str, store_names: List[str], more_reviews: int = 5) -> Dict:
+        """
+        여러 상호명 일괄 분석
+
+        1. 상호명 중복 제거 후 PLACE ID 동시 조회
+        2. 같은 PLACE ID로 해석된 상호명은 한 번만 크롤링
+        3. 브라우저당 CRAWL_TABS_PER_BROWSER개 매장을 탭으로 묶어 공유 동시성 한도 내에서 병렬 크롤링
+        4. 매장별 완료 이벤트와 최종 집계 이벤트 발행
+        """
+        gateway = RedisPubSubGateway()
+        channel = analytics_channel(batch_id)
+        names = list(dict.fromkeys(name.strip() for name in store_names if name.strip()))
+
+        # 1
+        resolved = await asyncio.gather(
+            *(self.resolve_place_id(name) for name in names), return_exceptions=True
+        )
+
+        # 2
+        names_by_place: Dict[str, List[str]] = {}
+        unresolved: List[str] = []
+        for name, place_id in zip(names, resolved):
+            if isinstance(place_id, Exception):
+                logger.warning(f"place_id 조회 실패 - name: {name}, error: {place_id}")
+                unresolved.append(name)
+                continue
+            names_by_place.setdefault(place_id, []).append(name)
+
+        # 3
+        async def analyze(place_id: str, reviews: Optional[List[Dict]], crawl_error: Optional[Exception]) -> Dict:
+            place_names = names_by_place[place_id]
+            result = {"place_id": place_id, "names": place_names}
+            try:
+                if crawl_error is not None:
+                    raise crawl_error
+                if not reviews:
+                    raise RuntimeError("크롤링 결과를 받지 못했습니다.")
+                inserted = await self.persist_reviews(place_names[0], place_id, reviews, track=True)
+                result.update(
+                    status="completed",
+                    review_count=len(reviews),
+                    inserted_count=inserted,
+                )
+                event_type = EventType.STORE_ANALYTICS_COMPLETED
+            except Exception as e:
+                logger.error(f"배치 분석 실패 - place_id: {place_id}, error: {e}")
+                result.update(status="failed", error=str(e))
+                event_type = EventType.STORE_ANALYTICS_FAILED
+
+            # 4 매장별 완료 이벤트
+            await gateway.publish_to_channel(
+                event_type, channel, {"event_type": event_type.value, "batch_id": batch_id, **result}
+            )
+            return result
+
+        async def analyze_chunk(place_ids: List[str]) -> List[Dict]:
+            # 브라우저 하나에서 탭으로 묶어 크롤링
+            try:
+                crawled, crawl_error = await self.crawl_reviews_many(place_ids, more_reviews), None
+            except Exception as e:
+                crawled, crawl_error = {}, e
+            return [await analyze(place_id, crawled.get(place_id), crawl_error) for place_id in place_ids]
+
+        place_ids = list(names_by_place)
+        chunks = [
+            place_ids[i:i + CRAWL_TABS_PER_BROWSER]
+            for i in range(0, len(place_ids), CRAWL_TABS_PER_BROWSER)
+        ]
+        results = [
+            result
+            for chunk_results in await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks))
+            for result in chunk_results
+        ]
+
+        # 4 최종 집계 이벤트
+        summary = {
+            "event_type": EventType.BATCH_ANALYTICS_COMPLETED.value,
+            "batch_id": batch_id,
+            "requested_count": len(names),
+            "store_count": len(results),
+            "completed_count": sum(1 for r in results if r["status"] == "completed"),
+            "failed_count": sum(1 for r in results if r["status"] == "failed"),
+            "unresolved_names": unresolved,
+            "stores": results,
+        }
+        await gateway.publish_to_channel(EventType.BATCH_ANALYTICS_COMPLETED, channel, summary)
+        return summary
+
+    async def resolve_place_id(self, store_name: str) -> str:
+        """상호명으로 PLACE ID 조회 (Redis 캐시 우선)"""
+        redis_client = await get_async_redis_client()
+        cache_key = build_cache_key(PLACE_ID_NAMESPACE, store_name)
+        cached = await redis_client.get(cache_key)
+        if cached is not None:
+            return str(cached)
+
+        html = await self._run_crawler(place_fetcher, store_name, False)
+        # 추출된 place id
+        try:
+            place_id = place_parser(html)
+        except ValueError:
+            await crawl_controller.record(classify_crawl_outcome(html, []))
+            raise
+        await crawl_controller.record(CrawlOutcome.OK)
+        await redis_client.set(cache_key, place_id, ex=PLACE_ID_CACHE_TTL)
+        return place_id
+
+    async def crawl_reviews(self, place_id: str, more_reviews: int) -> List[Dict]:
+        """
+        PLACE ID 리뷰 페이지 크롤링 후 파싱 결과 반환
+
+        다른 요청(레플리카 포함)이 같은 PLACE ID를 같은 더보기 횟수로 크롤링 중이면
+        새로 크롤링하지 않고 그 결과를 받는다.
+        """
+        return await _review_single_flight.run(
+            crawl_key(place_id, more_reviews), lambda: self._crawl_reviews(place_id, more_reviews)
+        )
+
+    async def crawl_reviews_many(self, place_ids: List[str], more_reviews: int) -> Dict[str, List[Dict]]:
+        """
+        브라우저 하나에서 여러 PLACE ID 리뷰 페이지를 탭으로 동시 크롤링
+
+        락을 잡은 PLACE ID만 탭으로 크롤링하고, 다른 곳에서 크롤링 중인 PLACE ID는 결과를 기다린다.
+        차단 페이지를 받은 탭은 대기자에게 빈 결과 대신 CrawlBlocked를 전달한다.
+        결과를 받지 못한(차단 포함) PLACE ID는 반환값에서 제외된다.
+        """
+        keys = {crawl_key(place_id, more_reviews): place_id for place_id in place_ids}
+        leases = await _review_single_flight.acquire_many(list(keys))
+        crawled: Dict[str, List[Dict]] = {}
+        if leases:
+            async with _review_single_flight.renewing(leases):
+                try:
+                    crawled, blocked = await self._crawl_reviews_many(
+                        [keys[key] for key in leases], more_reviews
+                    )
+                except Exception as e:
+                    await asyncio.gather(*(
+                        _review_single_flight.complete(key, token, error=e)
+                        for key, token in leases.items()
+                    ))
+                    raise
+            await asyncio.gather(*(
+                _review_single_flight.complete(key, token, error=CrawlBlocked())
+                if keys[key] in blocked
+                else _review_single_flight.complete(key, token, crawled.get(keys[key], []))
+                for key, token in leases.items()
+            ))
+
+        waiting = [place_id for key, place_id in keys.items() if key not in leases]
+        waited = await asyncio.gather(
+            *(self.crawl_reviews(place_id, more_reviews) for place_id in waiting), return_exceptions=True
+        )
+        for place_id, reviews in zip(waiting, waited):
+            if isinstance(reviews, Exception):
+                logger.error(f"크롤링 결과 대기 실패 - place_id: {place_id}, error: {reviews}")
+                continue
+            crawled[place_id] = reviews
+        return crawled
+
+    async def _crawl_reviews(self, place_id: str, more_reviews: int) -> List[Dict]:
+        html = await self._run_crawler(reviews_fetch, place_id, more_reviews)
+        reviews = reviews_parser(html)
+        outcome = classify_crawl_outcome(html, reviews)
+        await crawl_controller.record(outcome)
+        if outcome == CrawlOutcome.BLOCKED:
+            # 차단 페이지를 빈 결과로 넘기면 대기자/호출자가 "리뷰 없음"으로 처리하므로 오류로 전달
+            raise CrawlBlocked()
+        return reviews
+
+    async def _crawl_reviews_many(
+        self, place_ids: List[str], more_reviews: int
+    ) -> Tuple[Dict[str, List[Dict]], Set[str]]:
+        """return : (PLACE ID별 리뷰, 차단 페이지를 받은 PLACE ID)"""
+        pages = await self._run_crawler(reviews_fetch_many, place_ids, more_reviews, weight=len(place_ids))
+        crawled, blocked = {}, set()
+        for place_id, html in pages.items():
+            reviews = reviews_parser(html)
+            outcome = classify_crawl_outcome(html, reviews)
+            await crawl_controller.record(outcome)
+            if outcome == CrawlOutcome.BLOCKED:
+                blocked.add(place_id)
+            else:
+                crawled[place_id] = reviews
+        return crawled, blocked
+
+    async def _run_crawler(self, fetcher, *args, weight: int = 1):
+        """
+        브라우저 크롤러 실행
+
+        프로세스 내 동시 실행 한도(_crawl_semaphore)와 레플리카 공유 AIMD 슬롯을 모두 점유한 뒤
+        executor에서 실행한다. 크롤러 예외는 timeout으로 기록한다.
+        슬롯을 얻지 못하면 CrawlSlotTimeout (요청 경로에서는 main의 예외 핸들러가 503으로 변환)
+        """
+        async with crawl_controller.slot(weight, local=_crawl_semaphore):
+            try:
+                return await asyncio.get_event_loop().run_in_executor(None, fetcher, *args)
+            except Exception as e:
+                await crawl_controller.record(classify_crawl_outcome(None, [], e))
+                raise
+
+    async def filter_duplicate_reviews(self, reviews: List[Dict]) -> List[Dict]:
+        """유사 중복/템플릿 리뷰 제거 (MinHash LSH, executor에서 실행)"""
+        if not REVIEW_DEDUPE_ENABLED:
+            return reviews
+        unique = await asyncio.get_event_loop().run_in_executor(None, dedupe_reviews, reviews)
+        if len(unique) < len(reviews):
+            logger.info(f"유사 중복 리뷰 제외 - {len(reviews) - len(unique)}/{len(reviews)}건")
+        return unique
+
+    async def refresh_reviews(self, place_id: str, store_name: Optional[str] = None, more_reviews: int = 5) -> int:
+        """
+        리뷰 재수집 후 DB 반영
+
+        리뷰를 하나도 얻지 못하면(셀렉터 불일치 등) 매장 생성/수집 시각 갱신 없이 404
+        (차단 페이지는 크롤링 단계에서 CrawlBlocked)
+
+        return : 새로 저장된 리뷰 수
+        """
+        reviews = await self.crawl_reviews(place_id, more_reviews)
+        if not reviews:
+            raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없습니다.")
+        return await self.persist_reviews(store_name, place_id, reviews)
+
+    async def persist_reviews(
+        self, store_name: Optional[str], place_id: str, reviews: List[Dict], track: bool = False
+    ) -> int:
+        """
+        리뷰 DB 저장 후 새 리뷰가 있으면 해당 PLACE ID의 리뷰 페이지 캐시 무효화
+
+        track이 True이면 매장을 주기적 재수집 대상으로 등록한다.
+        리뷰가 없으면 크롤링이 성공한 것으로 볼 수 없으므로 매장 생성/수집 시각 갱신 없이 0을 반환한다.
+
+        return : 새로 저장된 리뷰 수
+        """
+        if not reviews:
+            return 0
+        inserted = await asyncio.get_event_loop().run_in_executor(
+            None, self._save_reviews, store_name, place_id, reviews, track
+        )
+        if inserted:
+            redis_client = await get_async_redis_client()
+            await redis_client.unlink_tracked(build_key_index(REVIEWS_NAMESPACE, place_id))
+        return inserted
+
+    async def get_stored_reviews(
+        self,
+        place_id: str,
+        size: int,
+        cursor: Optional[str] = None,
+        revisit_only: bool = False,
+    ) -> Dict:
+        """
+        저장된 리뷰 페이지 조회
+
+        1. Redis 페이지 캐시 확인
+        2. 첫 페이지 요청이면서 데이터가 없거나 오래된 경우에만 크롤링
+           (실패해도 저장된 리뷰가 있으면 그대로 응답, 없으면 크롤링 오류 전달)
+        3. DB 키셋 페이지네이션 조회 후 짧은 TTL로 캐싱 (빈 첫 페이지는 캐싱하지 않음)
+        """
+        redis_client = await get_async_redis_client()
+        cache_key = build_cache_key(
+            REVIEWS_NAMESPACE, place_id, "revisit" if revisit_only else "all", size, cursor or "first"
+        )
+        cached = await redis_client.get(cache_key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_event_loop()
+        refresh_error: Optional[Exception] = None
+        if cursor is None:
+            stale = await loop.run_in_executor(None, self._is_stale, place_id)
+            if stale:
+                try:
+                    await self.refresh_reviews(place_id)
+                except Exception as e:
+                    logger.warning(f"리뷰 재수집 실패 - place_id: {place_id}, error: {e}")
+                    refresh_error = e
+
+        try:
+            page = await loop.run_in_executor(
+                None, self._load_review_page, place_id, size, cursor, revisit_only
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if page is None or (cursor is None and not revisit_only and not page["reviews"]):
+            if refresh_error is not None:
+                raise refresh_error
+            raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없습니다.")
+
+        # 새 리뷰 저장 시 SCAN 없이 무효화할 수 있도록 place_id별 인덱스에 기록
+        await redis_client.set_tracked(
+            cache_key, page, build_key_index(REVIEWS_NAMESPACE, place_id), ex=REVIEW_PAGE_CACHE_TTL
+        )
+        return page
+
+    def _save_reviews(self, store_name, place_id, reviews, track=False):
+        """리뷰 영속화 (동기 DB 세션 사용, executor에서 실행)"""
+        with Session() as session:
+            store = get_or_create_store(session, place_id, store_name)
+            inserted = save_reviews(session, store.store_id, place_id, reviews)
+            now = datetime.now()
+            update_review_velocity(store, inserted, now)
+            store.last_crawled_at = now
+            if track:
+                store.is_tracked = True
+            session.commit()
+        return inserted
+
+    def _is_stale(self, place_id):
+        with Session() as session:
+            return is_stale(get_store_by_place_id(session, place_id), REVIEW_STALE_MINUTES)
+
+    def _load_review_page(self, place_id, size, cursor, revisit_only):
+        with Session() as session:
+            store = get_store_by_place_id(session, place_id)
+            if store is None:
+                return None
+            rows, next_cursor = fetch_stored_reviews(session, store.store_id, size, cursor, revisit_only)
+            return {
+                "place_id": place_id,
+                "review_count": len(rows),
+                "reviews": [
+                    {
+                        "review_id": row.review_id,
+                        "nickname": row.nickname,
+                        "content": row.content,
+                        "date": row.visit_date.isoformat(),
+                        "revisit": row.revisit,
+                        "is_revisit": row.is_revisit,
+                    }
+                    for row in rows
+                ],
+                "next_cursor": next_cursor,
+            }
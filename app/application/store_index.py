@@ -0,0 +1,173 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.config import STORE_INDEX_CELL_SIZE, STORE_INDEX_RELOAD_SECONDS
+from app.database import Session
+from app.services.store_index_service import (
+    search_item_to_store,
+    store_to_dict,
+    upsert_searched_stores,
+    load_located_stores,
+)
+from app.utils.spatial_index import COORD_SCALE, GridSpatialIndex, SpatialPoint
+
+logger = logging.getLogger(__name__)
+
+
+def to_coord(degrees: float) -> int:
+    return int(round(degrees * COORD_SCALE))
+
+
+class StoreIndex:
+    """
+    알려진 매장의 메모리 공간 인덱스 (워커별)
+
+    DB에 좌표가 저장된 매장을 updated_at 기준으로 주기적 증분 로딩하고,
+    지역 검색 결과는 즉시 인덱스에 넣은 뒤 DB에 저장하여 다른 워커/레플리카도 다음 로딩 때 반영한다.
+    DB에서 삭제된 매장은 재시작 전까지 인덱스에 남는다.
+    """
+
+    def __init__(self, cell_size: float = STORE_INDEX_CELL_SIZE):
+        self.index = GridSpatialIndex(cell_size)
+        self._loaded_until: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                loaded = await self.refresh()
+                if loaded:
+                    logger.info(f"매장 공간 인덱스 로딩 - {loaded}건 (전체 {len(self.index)}건)")
+            except Exception as e:
+                logger.error(f"매장 공간 인덱스 로딩 실패 - error: {e}")
+            await asyncio.sleep(STORE_INDEX_RELOAD_SECONDS)
+
+    async def refresh(self) -> int:
+        """
+        마지막 로딩 이후 수정된 매장만 반영 (첫 호출은 전체 로딩)
+
+        return : 반영한 매장 수
+        """
+        stores, loaded_until = await asyncio.get_event_loop().run_in_executor(
+            None, self._load, self._loaded_until
+        )
+        for data in stores:
+            self._upsert(data)
+        if loaded_until is not None:
+            self._loaded_until = loaded_until
+        return len(stores)
+
+    def _load(self, since: Optional[datetime]) -> Tuple[List[Dict], Optional[datetime]]:
+        with Session() as session:
+            stores = load_located_stores(session, since)
+            loaded_until = max((store.updated_at for store in stores), default=since)
+            return [store_to_dict(store) for store in stores], loaded_until
+
+    def _upsert(self, data: Dict) -> None:
+        current = self.index.get(data["key"])
+        store_id, place_id = data["store_id"], data["place_id"]
+        # 검색 결과(ID 없음)로 DB에서 로딩한 매장 ID를 덮어쓰지 않음
+        if current is not None and store_id is None:
+            _, _, store_id, place_id = current.payload
+        self.index.upsert(
+            data["key"],
+            data["mapx"],
+            data["mapy"],
+            data["category"],
+            # 수십만 건을 담으므로 dict 대신 튜플로 보관
+            (data["name"], data["address"], store_id, place_id),
+        )
+
+    def add_search_items(self, items: List[Dict]) -> List[Dict]:
+        """
+        지역 검색 결과를 인덱스에 즉시 반영
+
+        return : 좌표가 있어 반영된 매장
+        """
+        stores = [store for store in map(search_item_to_store, items) if store is not None]
+        for data in stores:
+            self._upsert(data)
+        return stores
+
+    async def persist_search_items(self, items: List[Dict]) -> None:
+        """
+        검색 결과 매장을 DB에 저장하고 부여된 매장 ID를 인덱스에 반영
+
+        이미 매장 ID가 있는(DB에 저장된) 매장은 건너뛰어 같은 검색이 반복돼도 쓰기가 발생하지 않는다.
+        """
+        stores = [
+            store for store in map(search_item_to_store, items)
+            if store is not None and not self._has_store_id(store["key"])
+        ]
+        if not stores:
+            return
+        try:
+            saved = await asyncio.get_event_loop().run_in_executor(None, self._persist, stores)
+        except Exception as e:
+            logger.warning(f"검색 결과 매장 저장 실패 - error: {e}")
+            return
+        for data in saved:
+            self._upsert(data)
+
+    def _has_store_id(self, key: str) -> bool:
+        current = self.index.get(key)
+        return current is not None and current.payload[2] is not None
+
+    def _persist(self, stores: List[Dict]) -> List[Dict]:
+        with Session() as session:
+            saved = [store_to_dict(store) for store in upsert_searched_stores(session, stores)]
+            session.commit()
+        return saved
+
+    @staticmethod
+    def _point_to_dict(point: SpatialPoint, distance: Optional[float] = None) -> Dict:
+        name, address, store_id, place_id = point.payload
+        result = {
+            "store_id": store_id,
+            "place_id": place_id,
+            "name": name,
+            "address": address,
+            "category": point.category,
+            "mapx": point.x,
+            "mapy": point.y,
+        }
+        if distance is not None:
+            result["distance"] = round(distance, 1)
+        return result
+
+    def nearby(
+        self, x: float, y: float, radius: float, category: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """경도/위도(도) 기준 반경(m) 내 매장, 가까운 순"""
+        return [
+            self._point_to_dict(point, distance)
+            for distance, point in self.index.radius(to_coord(x), to_coord(y), radius, category, limit)
+        ]
+
+    def within(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """경도/위도(도) 사각 영역 내 매장"""
+        points = self.index.bbox(to_coord(min_x), to_coord(min_y), to_coord(max_x), to_coord(max_y), category, limit)
+        return [self._point_to_dict(point) for point in points]
+
+
+store_index = StoreIndex()
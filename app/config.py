@@ -6,6 +6,17 @@ load_dotenv()
 # Naver Search OPEN API Keys
 NAVER_CLIENT_ID: str = os.getenv("NAVER_CLIENT_ID", "")
 NAVER_CLIENT_SECRET: str = os.getenv("NAVER_CLIENT_SECRET", "")
+# 키 세트 여러 개 사용 시 "id1:secret1,id2:secret2" (미설정 시 위 단일 키 사용)
+NAVER_CREDENTIALS: str = os.getenv("NAVER_CREDENTIALS", "")
+# 키 세트별 호출 한도
+NAVER_OPENAPI_RATE_PER_SEC: float = float(os.getenv("NAVER_OPENAPI_RATE_PER_SEC", "10"))
+NAVER_OPENAPI_BURST: int = int(os.getenv("NAVER_OPENAPI_BURST", "10"))
+NAVER_OPENAPI_DAILY_QUOTA: int = int(os.getenv("NAVER_OPENAPI_DAILY_QUOTA", "25000"))
+# 토큰 부족 시 최대 대기 시간 (초)
+NAVER_OPENAPI_MAX_WAIT: float = float(os.getenv("NAVER_OPENAPI_MAX_WAIT", "2"))
+# 지역 검색 확장 시 키워드 뒤에 붙여 볼 검색어 (쉼표 구분, API가 start 1 / display 5로 제한되므로 검색어를 바꿔 결과를 모음)
+# 접미어에 따라 키워드와 무관한 장소가 섞일 수 있어 기본값은 비활성 (예: "맛집,추천")
+LOCAL_SEARCH_QUERY_SUFFIXES: str = os.getenv("LOCAL_SEARCH_QUERY_SUFFIXES", "")
 
 # NCP Keys
 X_NCP_APIGW_API_KEY_ID: str = os.getenv("X_NCP_APIGW_API_KEY_ID", "")
@@ -31,4 +42,65 @@ REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
 REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "10"))
 REDIS_SOCKET_TIMEOUT: int = int(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
 REDIS_CONNECT_TIMEOUT: int = int(os.getenv("REDIS_CONNECT_TIMEOUT", "5"))
-REDIS_HEALTH_CHECK_INTERVAL: int = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
\ No newline at end of file
+REDIS_HEALTH_CHECK_INTERVAL: int = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+# 프로세스 내 니어 캐시 (opt-in)
+REDIS_NEAR_CACHE_ENABLED: bool = os.getenv("REDIS_NEAR_CACHE_ENABLED", "false").lower() == "true"
+REDIS_NEAR_CACHE_MAX_ENTRIES: int = int(os.getenv("REDIS_NEAR_CACHE_MAX_ENTRIES", "10000"))
+REDIS_NEAR_CACHE_TTL: float = float(os.getenv("REDIS_NEAR_CACHE_TTL", "30"))
+# 니어 캐시 대상 키 prefix (쉼표 구분)
+REDIS_NEAR_CACHE_PREFIXES: tuple = tuple(
+    prefix for prefix in os.getenv("REDIS_NEAR_CACHE_PREFIXES", "place_id:,report:").split(",") if prefix
+)
+
+# 리뷰 조회 설정
+REVIEW_STALE_MINUTES: int = int(os.getenv("REVIEW_STALE_MINUTES", "360"))
+REVIEW_PAGE_CACHE_TTL: int = int(os.getenv("REVIEW_PAGE_CACHE_TTL", "60"))
+
+# 보고서 캐시 설정 (상호명 -> 매장 ID / 최신 보고서)
+REPORT_CACHE_TTL: int = int(os.getenv("REPORT_CACHE_TTL", "86400"))
+# 외부에서 보고서를 저장하면 무효화 전까지 이전 보고서가 보이므로 짧게 유지
+REPORT_LATEST_CACHE_TTL: int = int(os.getenv("REPORT_LATEST_CACHE_TTL", "300"))
+
+# 크롤링 설정
+CRAWL_MAX_CONCURRENCY: int = int(os.getenv("CRAWL_MAX_CONCURRENCY", "4"))
+CRAWL_TABS_PER_BROWSER: int = int(os.getenv("CRAWL_TABS_PER_BROWSER", "5"))
+# 레플리카 전체 동시 크롤링 한도 (AIMD로 MIN~MAX 사이에서 자동 조절)
+CRAWL_AIMD_INITIAL_LIMIT: float = float(os.getenv("CRAWL_AIMD_INITIAL_LIMIT", "4"))
+CRAWL_AIMD_MIN_LIMIT: float = float(os.getenv("CRAWL_AIMD_MIN_LIMIT", "1"))
+CRAWL_AIMD_MAX_LIMIT: float = float(os.getenv("CRAWL_AIMD_MAX_LIMIT", "16"))
+CRAWL_AIMD_DECREASE_FACTOR: float = float(os.getenv("CRAWL_AIMD_DECREASE_FACTOR", "0.5"))
+# 연속 차단 횟수가 임계치에 도달하면 서킷 브레이커 작동 (지수 백오프, 초)
+CRAWL_BREAKER_THRESHOLD: int = int(os.getenv("CRAWL_BREAKER_THRESHOLD", "3"))
+CRAWL_BREAKER_BASE_BACKOFF: int = int(os.getenv("CRAWL_BREAKER_BASE_BACKOFF", "30"))
+CRAWL_BREAKER_MAX_BACKOFF: int = int(os.getenv("CRAWL_BREAKER_MAX_BACKOFF", "1800"))
+# 크롤링 슬롯 임대 시간 / 슬롯 획득 최대 대기 시간 (초)
+CRAWL_SLOT_LEASE: int = int(os.getenv("CRAWL_SLOT_LEASE", "300"))
+CRAWL_SLOT_MAX_WAIT: int = int(os.getenv("CRAWL_SLOT_MAX_WAIT", "60"))
+# 동일 place_id 중복 크롤링 방지 락 임대 / 결과 보관 / 결과 대기 시간 (초)
+CRAWL_LOCK_LEASE: int = int(os.getenv("CRAWL_LOCK_LEASE", "30"))
+CRAWL_RESULT_TTL: int = int(os.getenv("CRAWL_RESULT_TTL", "60"))
+CRAWL_WAIT_TIMEOUT: int = int(os.getenv("CRAWL_WAIT_TIMEOUT", "600"))
+PLACE_ID_CACHE_TTL: int = int(os.getenv("PLACE_ID_CACHE_TTL", "86400"))
+
+# 주기적 재수집 스케줄러
+RECRAWL_ENABLED: bool = os.getenv("RECRAWL_ENABLED", "false").lower() == "true"
+RECRAWL_HOURLY_BUDGET: int = int(os.getenv("RECRAWL_HOURLY_BUDGET", "60"))
+RECRAWL_TICK_SECONDS: int = int(os.getenv("RECRAWL_TICK_SECONDS", "60"))
+RECRAWL_JITTER_SECONDS: int = int(os.getenv("RECRAWL_JITTER_SECONDS", "30"))
+RECRAWL_MIN_INTERVAL_HOURS: float = float(os.getenv("RECRAWL_MIN_INTERVAL_HOURS", "1"))
+RECRAWL_MAX_INTERVAL_HOURS: float = float(os.getenv("RECRAWL_MAX_INTERVAL_HOURS", "168"))
+# 예상 신규 리뷰 수가 이 값 이상이면 재수집
+RECRAWL_MIN_EXPECTED_REVIEWS: float = float(os.getenv("RECRAWL_MIN_EXPECTED_REVIEWS", "1"))
+
+# 리뷰 유사 중복 제거 (MinHash LSH)
+REVIEW_DEDUPE_ENABLED: bool = os.getenv("REVIEW_DEDUPE_ENABLED", "true").lower() == "true"
+# 추정 Jaccard 유사도가 이 값 이상이면 중복
+REVIEW_DEDUPE_THRESHOLD: float = float(os.getenv("REVIEW_DEDUPE_THRESHOLD", "0.8"))
+REVIEW_DEDUPE_NUM_PERM: int = int(os.getenv("REVIEW_DEDUPE_NUM_PERM", "128"))
+REVIEW_DEDUPE_SHINGLE_SIZE: int = int(os.getenv("REVIEW_DEDUPE_SHINGLE_SIZE", "3"))
+# 정규화 후 이보다 짧은 리뷰는 중복 판정 제외
+REVIEW_DEDUPE_MIN_LENGTH: int = int(os.getenv("REVIEW_DEDUPE_MIN_LENGTH", "10"))
+
+# 매장 공간 인덱스 (격자 크기(도), DB 증분 로딩 주기(초))
+STORE_INDEX_CELL_SIZE: float = float(os.getenv("STORE_INDEX_CELL_SIZE", "0.005"))
+STORE_INDEX_RELOAD_SECONDS: int = int(os.getenv("STORE_INDEX_RELOAD_SECONDS", "60"))
\ No newline at end of file
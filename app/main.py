@@ -1,15 +1,50 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from app.config import RECRAWL_ENABLED
+from app.redis_client import close_async_redis_client
+from app.application.recrawl_scheduler import recrawl_scheduler
+from app.application.store_index import store_index
+from app.services.crawl_controller import CrawlUnavailable
 from app.api.stores import router as stores_router
 from app.api.places import router as place_id_router
 from app.api.reviews import router as reviews_router
 from app.api.store_controller import router as store_router
+from app.api.report_controller import router as report_router
+from app.api.metrics_controller import router as metrics_router
+from app.api.cache_controller import router as cache_router
+from app.api.scheduler_controller import router as scheduler_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    store_index.start()
+    if RECRAWL_ENABLED:
+        recrawl_scheduler.start()
+    yield
+    await recrawl_scheduler.stop()
+    await store_index.stop()
+    await close_async_redis_client()
+
+
+app = FastAPI(title="Naver Map Crawling API", lifespan=lifespan)
+
+
+@app.exception_handler(CrawlUnavailable)
+async def crawl_unavailable_handler(request: Request, exc: CrawlUnavailable):
+    # 슬롯 대기 초과/차단은 백그라운드 작업에서는 일반 예외로, 요청 경로에서는 503으로 처리
+    return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
 
-app = FastAPI(title="Naver Map Crawling API")
 
 app.include_router(stores_router, prefix="/api")
 app.include_router(reviews_router, prefix="/api")
 app.include_router(place_id_router, prefix="/api")
 app.include_router(store_router, prefix="/api/v2")
+app.include_router(report_router, prefix="/api/v2")
+app.include_router(metrics_router, prefix="/api/v2")
+app.include_router(cache_router, prefix="/api/v2")
+app.include_router(scheduler_router, prefix="/api/v2")
 
 if __name__ == "__main__":
     import uvicorn
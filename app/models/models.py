@@ -1,17 +1,29 @@
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, List
-from sqlalchemy import BIGINT, String, Float, Integer, JSON, DateTime, ForeignKey, text
+from sqlalchemy import BIGINT, String, Float, Integer, Boolean, JSON, Text, Date, DateTime, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
 class Store(Base):
     __tablename__ = "store"
+    __table_args__ = (
+        # 공간 인덱스 증분 로딩용
+        Index("ix_store_updated_at", "updated_at"),
+        # 검색 결과 매장 upsert 대상 (주소가 NULL인 리뷰 수집 매장은 제약에 걸리지 않음)
+        UniqueConstraint("name", "address", name="uq_store_name_address"),
+    )
     
     store_id: Mapped[int] = mapped_column(BIGINT, primary_key=True, comment="기본키")
-    name: Mapped[str] = mapped_column(String(100), nullable=False, comment="매장명")
+    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True, comment="매장명")
+    place_id: Mapped[Optional[str]] = mapped_column(String(30), nullable=True, unique=True, comment="네이버플레이스 ID")
     address: Mapped[Optional[str]] = mapped_column(String(200), nullable=True, comment="주소")
     category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, comment="카테고리")
     store_image: Mapped[Optional[str]] = mapped_column(String(500), nullable=True, comment="매장 이미지")
+    mapx: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="경도 (WGS84 × 10^7)")
+    mapy: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="위도 (WGS84 × 10^7)")
+    last_crawled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, comment="마지막 리뷰 수집일시")
+    is_tracked: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("0"), index=True, comment="주기적 재수집 대상 여부")
+    review_velocity: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment="시간당 신규 리뷰 수 추정치 (EWMA)")
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
         nullable=False, 
@@ -28,10 +40,15 @@ class Store(Base):
     
     # Relationship
     reports: Mapped[List["Report"]] = relationship("Report", back_populates="store")
+    reviews: Mapped[List["Review"]] = relationship("Review", back_populates="store")
 
 
 class Report(Base):
     __tablename__ = "report"
+    __table_args__ = (
+        # 매장별 최신 보고서 조회용
+        Index("ix_report_store_id_created_at", "store_id", "created_at"),
+    )
     
     report_id: Mapped[int] = mapped_column(BIGINT, primary_key=True, comment="기본키")
     request_member_id: Mapped[int] = mapped_column(BIGINT, nullable=False, comment="요청 회원 ID")
@@ -42,8 +59,9 @@ class Report(Base):
         comment="매장 ID"
     )
     average_review_rate: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment="평균 리뷰 점수")
-    popular_keywords: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="키워드 목록")
-    analytics_result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, comment="분석 결과")
+    # 대용량 JSON 컬럼은 요청 시에만 로딩 (undefer)
+    popular_keywords: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, deferred=True, comment="키워드 목록")
+    analytics_result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, deferred=True, comment="분석 결과")
     total_review_count: Mapped[int] = mapped_column(
         Integer, 
         nullable=False, 
@@ -58,4 +76,39 @@ class Report(Base):
     )
     
     # Relationship
-    store: Mapped["Store"] = relationship("Store", back_populates="reports")
\ No newline at end of file
+    store: Mapped["Store"] = relationship("Store", back_populates="reports")
+
+
+class Review(Base):
+    __tablename__ = "review"
+    __table_args__ = (
+        Index("ix_review_store_id_visit_date", "store_id", "visit_date"),
+    )
+    
+    review_id: Mapped[int] = mapped_column(BIGINT, primary_key=True, comment="기본키")
+    store_id: Mapped[int] = mapped_column(
+        BIGINT, 
+        ForeignKey("store.store_id"), 
+        nullable=False, 
+        comment="매장 ID"
+    )
+    content_hash: Mapped[str] = mapped_column(
+        String(64), 
+        nullable=False, 
+        unique=True, 
+        comment="(place_id, 닉네임, 방문일, 내용) SHA-256 해시"
+    )
+    nickname: Mapped[str] = mapped_column(String(100), nullable=False, server_default="", comment="작성자 닉네임")
+    content: Mapped[str] = mapped_column(Text, nullable=False, comment="리뷰 내용")
+    visit_date: Mapped[date] = mapped_column(Date, nullable=False, comment="방문일")
+    revisit: Mapped[str] = mapped_column(String(50), nullable=False, server_default="", comment="방문 횟수 표기")
+    is_revisit: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("0"), comment="재방문 여부")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, 
+        nullable=False, 
+        server_default=text("CURRENT_TIMESTAMP"), 
+        comment="수집일시"
+    )
+    
+    # Relationship
+    store: Mapped["Store"] = relationship("Store", back_populates="reviews")
@@ -1,7 +1,8 @@
 # infrastructure/cache/redis_client.py
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, AsyncIterator, Dict, Optional, Union, List, Tuple
 from datetime import timedelta
 
 import redis.asyncio as aioredis
@@ -10,9 +11,37 @@ from redis.asyncio.connection import ConnectionPool
 from redis.exceptions import ConnectionError, TimeoutError, RedisError
 
 from app.config import REDIS_PASSWORD, REDIS_HOST, REDIS_PORT, REDIS_DB, REDIS_MAX_CONNECTIONS, REDIS_SOCKET_TIMEOUT, REDIS_CONNECT_TIMEOUT, REDIS_HEALTH_CHECK_INTERVAL
+from app.config import REDIS_NEAR_CACHE_ENABLED, REDIS_NEAR_CACHE_MAX_ENTRIES, REDIS_NEAR_CACHE_TTL, REDIS_NEAR_CACHE_PREFIXES
+from app.utils.near_cache import MISS, NearCache
 
 logger = logging.getLogger(__name__)
 
+# 니어 캐시 무효화 채널 (모든 레플리카가 구독)
+NEAR_CACHE_INVALIDATION_CHANNEL = "__near_cache__:invalidate"
+# 무효화 채널 연결이 끊겼을 때 재연결 대기 시간 (초)
+_NEAR_CACHE_RECONNECT_DELAY = 1.0
+# SCAN 1회당 조회 힌트 / UNLINK 1회당 삭제 키 수
+SCAN_COUNT = 500
+UNLINK_BATCH_SIZE = 500
+# 메모리 사용량 집계 시 기본 표본 키 수 (전체 키스페이스 순회 방지)
+MEMORY_USAGE_MAX_KEYS = 10_000
+
+
+def escape_glob(value: str) -> str:
+    """SCAN MATCH 패턴에서 키 일부를 문자 그대로 매칭하도록 이스케이프"""
+    return "".join("\\" + ch if ch in "*?[]\\" else ch for ch in value)
+
+
+def _decode(value: Optional[str]) -> Optional[Any]:
+    """저장된 값 JSON 파싱 (JSON이 아니면 원본 문자열)"""
+    if value is None:
+        return None
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+
+
 class AsyncRedisClient:
     """비동기 Redis 클라이언트 래퍼 클래스"""
     
@@ -21,6 +50,9 @@ class AsyncRedisClient:
         self._client: Optional[aioredis.Redis] = None
         self.redis_url = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}"
         self._pubsub_instances: Dict[str, client.PubSub] = {}
+        self._scripts: Dict[str, Any] = {}
+        self._near_cache: Optional[NearCache] = None
+        self._invalidation_task: Optional[asyncio.Task] = None
     
     async def _initialize_client(self):
         """Redis 클라이언트 초기화"""
@@ -59,6 +91,65 @@ class AsyncRedisClient:
         
         return self._client
     
+    def enable_near_cache(self, max_entries: int, ttl: float, prefixes: Tuple[str, ...] = ()) -> None:
+        """
+        프로세스 내 니어 캐시 활성화 (opt-in)
+        
+        prefixes에 해당하는 키의 GET/MGET 결과(디코딩된 값)를 LRU로 보관한다.
+        이 클라이언트를 통한 쓰기(SET/DELETE/EXPIRE/INCR/DECR/MSET)는 무효화 채널로 전파되어
+        모든 레플리카의 니어 캐시에서 제거된다. Lua 스크립트나 raw 클라이언트로 쓴 키는
+        전파되지 않으므로 니어 캐시 대상 prefix에 포함하지 않는다.
+        """
+        self._near_cache = NearCache(max_entries, ttl, prefixes)
+    
+    def near_cache_stats(self) -> Optional[Dict]:
+        """니어 캐시 적중률/메모리 사용량 (비활성화 시 None)"""
+        return self._near_cache.stats() if self._near_cache else None
+    
+    def _near_cached(self, key: str) -> bool:
+        return self._near_cache is not None and self._near_cache.accepts(key)
+    
+    async def _ensure_invalidation_listener(self) -> None:
+        if self._invalidation_task is None or self._invalidation_task.done():
+            self._invalidation_task = asyncio.create_task(self._listen_invalidations())
+    
+    async def _listen_invalidations(self) -> None:
+        """무효화 채널 구독 (연결 끊김 시 캐시 비우고 재연결)"""
+        while True:
+            pubsub = None
+            try:
+                client = await self.get_client()
+                pubsub = client.pubsub()
+                await pubsub.subscribe(NEAR_CACHE_INVALIDATION_CHANNEL)
+                # 구독 이전 변경분은 알 수 없으므로 비우고 시작
+                self._near_cache.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._near_cache.invalidate(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"니어 캐시 무효화 채널 오류, 재연결 - error: {e}")
+                self._near_cache.clear()
+                await asyncio.sleep(_NEAR_CACHE_RECONNECT_DELAY)
+            finally:
+                if pubsub is not None:
+                    await pubsub.close()
+    
+    async def _invalidate(self, *keys: str) -> None:
+        """쓰기 후 로컬 니어 캐시 제거 및 다른 레플리카에 무효화 전파"""
+        if self._near_cache is None:
+            return
+        targets = [key for key in keys if self._near_cache.accepts(key)]
+        if not targets:
+            return
+        self._near_cache.invalidate(targets)
+        try:
+            client = await self.get_client()
+            await client.publish(NEAR_CACHE_INVALIDATION_CHANNEL, json.dumps(targets, ensure_ascii=False))
+        except RedisError as e:
+            logger.error(f"니어 캐시 무효화 전파 오류 - keys: {targets}, error: {e}")
+    
     async def get_pubsub_for_channel(self, channel: str) -> client.PubSub:
         """채널별 PubSub 인스턴스 반환 (비동기)"""
         if channel not in self._pubsub_instances:
@@ -94,6 +185,8 @@ class AsyncRedisClient:
                 value = json.dumps(value, ensure_ascii=False)
             
             result = await client.set(key, value, ex=ex, px=px, nx=nx, xx=xx)
+            if result:
+                await self._invalidate(key)
             return bool(result) if result is not None else False
             
         except RedisError as e:
@@ -111,18 +204,22 @@ class AsyncRedisClient:
             저장된 값 (JSON이면 자동으로 파싱)
         """
         try:
+            near_cached = self._near_cached(key)
+            if near_cached:
+                await self._ensure_invalidation_listener()
+                cached = self._near_cache.get(key)
+                if cached is not MISS:
+                    return cached
+                generation = self._near_cache.generation
+            
             client = await self.get_client()
             value = await client.get(key)
             
-            if value is None:
-                return None
-            
             # JSON 파싱 시도
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                # JSON이 아니면 원본 문자열 반환
-                return value
+            decoded = _decode(value)
+            if near_cached and value is not None:
+                self._near_cache.put(key, decoded, len(value.encode("utf-8")), generation)
+            return decoded
                 
         except RedisError as e:
             logger.error(f"Redis GET 오류 - key: {key}, error: {e}")
@@ -133,6 +230,7 @@ class AsyncRedisClient:
         try:
             client = await self.get_client()
             result = await client.delete(*keys)
+            await self._invalidate(*keys)
             return int(result) if result is not None else 0
         except RedisError as e:
             logger.error(f"Redis DELETE 오류 - keys: {keys}, error: {e}")
@@ -153,6 +251,7 @@ class AsyncRedisClient:
         try:
             client = await self.get_client()
             result = await client.expire(key, time)
+            await self._invalidate(key)
             return bool(result) if result is not None else False
         except RedisError as e:
             logger.error(f"Redis EXPIRE 오류 - key: {key}, error: {e}")
@@ -173,6 +272,7 @@ class AsyncRedisClient:
         try:
             client = await self.get_client()
             result = await client.incr(key, amount)
+            await self._invalidate(key)
             return int(result) if result is not None else 0
         except RedisError as e:
             logger.error(f"Redis INCR 오류 - key: {key}, error: {e}")
@@ -183,11 +283,257 @@ class AsyncRedisClient:
         try:
             client = await self.get_client()
             result = await client.decr(key, amount)
+            await self._invalidate(key)
             return int(result) if result is not None else 0
         except RedisError as e:
             logger.error(f"Redis DECR 오류 - key: {key}, error: {e}")
             return 0
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        여러 키 일괄 조회 (비동기)
+        
+        니어 캐시에 있는 키는 제외하고 나머지만 MGET 한 번으로 조회한다.
+        
+        Returns:
+            keys 순서대로 저장된 값 (없으면 None)
+        """
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing: List[int] = []
+        generation = self._near_cache.generation if self._near_cache else 0
+        if self._near_cache is not None:
+            await self._ensure_invalidation_listener()
+        for i, key in enumerate(keys):
+            cached = self._near_cache.get(key) if self._near_cached(key) else MISS
+            if cached is MISS:
+                missing.append(i)
+            else:
+                results[i] = cached
+        if not missing:
+            return results
+        
+        try:
+            client = await self.get_client()
+            values = await client.mget([keys[i] for i in missing])
+        except RedisError as e:
+            logger.error(f"Redis MGET 오류 - keys: {keys}, error: {e}")
+            return results
+        
+        for i, value in zip(missing, values):
+            results[i] = _decode(value)
+            if value is not None and self._near_cached(keys[i]):
+                self._near_cache.put(keys[i], results[i], len(value.encode("utf-8")), generation)
+        return results
+    
+    async def mset(self, mapping: Dict[str, Any], ex: Optional[Union[int, timedelta]] = None) -> bool:
+        """
+        여러 키 일괄 저장 (비동기)
+        
+        만료 시간이 없으면 MSET, 있으면 파이프라인으로 SET EX를 한 번에 전송한다.
+        """
+        if not mapping:
+            return True
+        encoded = {
+            key: value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+            for key, value in mapping.items()
+        }
+        try:
+            client = await self.get_client()
+            if ex is None:
+                result = await client.mset(encoded)
+            else:
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, value in encoded.items():
+                        pipe.set(key, value, ex=ex)
+                    result = all(await pipe.execute())
+            await self._invalidate(*encoded)
+            return bool(result)
+        except RedisError as e:
+            logger.error(f"Redis MSET 오류 - keys: {list(mapping)}, error: {e}")
+            return False
+    
+    async def pipeline(self, transaction: bool = False) -> client.Pipeline:
+        """
+        파이프라인 반환 (비동기) - 여러 명령을 한 번의 왕복으로 전송
+        
+        파이프라인으로 쓴 키는 니어 캐시 무효화가 전파되지 않으므로
+        니어 캐시 대상 키는 set/mset/delete를 사용한다.
+        """
+        client = await self.get_client()
+        return client.pipeline(transaction=transaction)
+    
+    async def eval_script(self, script: str, keys: List[str], args: List[Any]) -> Optional[Any]:
+        """
+        Lua 스크립트 실행 (비동기)
+        
+        스크립트는 최초 1회 등록 후 EVALSHA로 실행된다.
+        
+        Args:
+            script: Lua 스크립트 원문
+            keys: KEYS 인자
+            args: ARGV 인자
+        """
+        try:
+            client = await self.get_client()
+            if script not in self._scripts:
+                self._scripts[script] = client.register_script(script)
+            return await self._scripts[script](keys=keys, args=args)
+        except RedisError as e:
+            logger.error(f"Redis EVAL 오류 - keys: {keys}, error: {e}")
+            return None
+    
+    async def scan_iter(self, match: str = "*", count: int = SCAN_COUNT) -> AsyncIterator[str]:
+        """
+        패턴에 매칭되는 키 순회 (비동기) - SCAN 커서 기반으로 Redis를 블로킹하지 않음
+        
+        순회 중 추가/삭제된 키는 포함되지 않을 수 있다.
+        """
+        client = await self.get_client()
+        async for key in client.scan_iter(match=match, count=count):
+            yield key
+    
+    async def sscan_iter(self, key: str, match: Optional[str] = None, count: int = SCAN_COUNT) -> AsyncIterator[str]:
+        """Set 멤버 순회 (비동기) - SSCAN 커서 기반"""
+        client = await self.get_client()
+        async for member in client.sscan_iter(key, match=match, count=count):
+            yield member
+    
+    async def unlink(self, *keys: str) -> int:
+        """키 삭제 (비동기) - 메모리 회수는 백그라운드 스레드에서 처리되어 큰 값도 블로킹하지 않음"""
+        if not keys:
+            return 0
+        try:
+            client = await self.get_client()
+            result = await client.unlink(*keys)
+            await self._invalidate(*keys)
+            return int(result) if result is not None else 0
+        except RedisError as e:
+            logger.error(f"Redis UNLINK 오류 - keys: {keys}, error: {e}")
+            return 0
+    
+    async def delete_pattern(self, match: str, batch_size: int = UNLINK_BATCH_SIZE) -> int:
+        """
+        패턴에 매칭되는 키 일괄 삭제 (비동기)
+        
+        SCAN으로 찾은 키를 batch_size 단위로 UNLINK 한다.
+        
+        Returns:
+            삭제된 키 수
+        """
+        deleted = 0
+        batch: List[str] = []
+        try:
+            async for key in self.scan_iter(match):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.unlink(*batch)
+                    batch = []
+            deleted += await self.unlink(*batch)
+        except RedisError as e:
+            logger.error(f"Redis 패턴 삭제 오류 - match: {match}, error: {e}")
+        return deleted
+    
+    async def set_tracked(
+        self,
+        key: str,
+        value: Any,
+        index_key: str,
+        ex: Optional[Union[int, timedelta]] = None,
+    ) -> bool:
+        """
+        값 저장 후 키를 인덱스 Set(index_key)에 기록 (비동기)
+        
+        같은 대상의 캐시 키들을 unlink_tracked로 SCAN 없이 한 번에 삭제하기 위해 사용한다.
+        인덱스 Set의 만료 시간은 저장할 때마다 ex로 연장된다.
+        """
+        try:
+            client = await self.get_client()
+            if not isinstance(value, str):
+                value = json.dumps(value, ensure_ascii=False)
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(key, value, ex=ex)
+                pipe.sadd(index_key, key)
+                if ex is not None:
+                    pipe.expire(index_key, ex)
+                result, *_ = await pipe.execute()
+            await self._invalidate(key)
+            return bool(result)
+        except RedisError as e:
+            logger.error(f"Redis SET(인덱스) 오류 - key: {key}, index: {index_key}, error: {e}")
+            return False
+    
+    async def unlink_tracked(self, index_key: str, batch_size: int = UNLINK_BATCH_SIZE) -> int:
+        """
+        인덱스 Set에 기록된 키와 인덱스 Set 삭제 (비동기)
+        
+        SSCAN으로 인덱스 Set만 순회하므로 전체 키스페이스 크기와 무관하다.
+        
+        Returns:
+            삭제된 키 수 (인덱스 Set 제외)
+        """
+        deleted = 0
+        batch: List[str] = []
+        try:
+            async for key in self.sscan_iter(index_key):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.unlink(*batch)
+                    batch = []
+            deleted += await self.unlink(*batch)
+            await self.unlink(index_key)
+        except RedisError as e:
+            logger.error(f"Redis 인덱스 키 삭제 오류 - index: {index_key}, error: {e}")
+        return deleted
+    
+    async def invalidate_namespace(self, namespace: str, *parts: Any) -> int:
+        """
+        네임스페이스 단위 캐시 무효화 (비동기)
+        
+        예: invalidate_namespace("reviews", place_id) → reviews:{place_id} 및 reviews:{place_id}:* 삭제
+        """
+        prefix = ":".join([namespace, *(str(part) for part in parts)])
+        deleted = await self.unlink(prefix) if parts else 0
+        return deleted + await self.delete_pattern(f"{escape_glob(prefix)}:*")
+    
+    async def memory_usage_by_namespace(
+        self, match: str = "*", max_keys: Optional[int] = MEMORY_USAGE_MAX_KEYS
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        네임스페이스(첫 ':' 앞부분)별 키 수와 메모리 사용량 집계 (비동기)
+        
+        SCAN으로 순회하며 MEMORY USAGE를 파이프라인으로 묶어 조회한다.
+        기본적으로 max_keys개까지만 표본 집계하며, None이면 전체 키를 순회한다.
+        """
+        usage: Dict[str, Dict[str, int]] = {}
+        
+        async def flush(keys: List[str]) -> None:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.memory_usage(key)
+                sizes = await pipe.execute()
+            for key, size in zip(keys, sizes):
+                stats = usage.setdefault(key.split(":", 1)[0], {"keys": 0, "bytes": 0})
+                stats["keys"] += 1
+                stats["bytes"] += int(size or 0)
+        
+        try:
+            client = await self.get_client()
+            batch: List[str] = []
+            scanned = 0
+            async for key in self.scan_iter(match):
+                batch.append(key)
+                scanned += 1
+                if len(batch) >= SCAN_COUNT:
+                    await flush(batch)
+                    batch = []
+                if max_keys is not None and scanned >= max_keys:
+                    break
+            if batch:
+                await flush(batch)
+        except RedisError as e:
+            logger.error(f"Redis 메모리 사용량 집계 오류 - match: {match}, error: {e}")
+        return usage
+    
     async def flushdb(self) -> bool:
         """현재 DB의 모든 키 삭제 (비동기) - 개발용"""
         try:
@@ -199,7 +545,7 @@ class AsyncRedisClient:
             return False
     
     async def keys(self, pattern: str = "*") -> List[str]:
-        """패턴에 매칭되는 키 조회 (비동기) - 주의: 운영에서는 사용 금지"""
+        """패턴에 매칭되는 키 조회 (비동기) - 주의: 운영에서는 사용 금지 (scan_iter 사용)"""
         try:
             client = await self.get_client()
             result = await client.keys(pattern)
@@ -210,6 +556,9 @@ class AsyncRedisClient:
     
     async def close(self):
         """연결 종료 (비동기)"""
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            self._invalidation_task = None
         if self._client:
             await self._client.aclose()
         if self._pool:
@@ -278,6 +627,10 @@ async def get_async_redis_client() -> AsyncRedisClient:
     
     if _async_redis_client is None:
         _async_redis_client = AsyncRedisClient()
+        if REDIS_NEAR_CACHE_ENABLED:
+            _async_redis_client.enable_near_cache(
+                REDIS_NEAR_CACHE_MAX_ENTRIES, REDIS_NEAR_CACHE_TTL, REDIS_NEAR_CACHE_PREFIXES
+            )
     
     return _async_redis_client
 
@@ -0,0 +1,6 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+class BatchAnalyticsRequest(BaseModel):
+    names: List[str] = Field(..., min_length=1, max_length=100, description="분석할 상호명 목록")
+    more_reviews: int = Field(5, ge=1, le=100, description="리뷰 '더보기' 클릭 횟수")
@@ -9,4 +9,7 @@ class EventType(str, Enum):
     CONNECT = "CONNECT"
     ERROR = "ERROR"
     ACCEPT_QUOTATION = "ACCEPT_QUOTATION"
-    RECEIVE_QUOTATION_ACCEPTED = "RECEIVE_QUOTATION_ACCEPTED"
\ No newline at end of file
+    RECEIVE_QUOTATION_ACCEPTED = "RECEIVE_QUOTATION_ACCEPTED"
+    STORE_ANALYTICS_COMPLETED = "STORE_ANALYTICS_COMPLETED"
+    STORE_ANALYTICS_FAILED = "STORE_ANALYTICS_FAILED"
+    BATCH_ANALYTICS_COMPLETED = "BATCH_ANALYTICS_COMPLETED"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 
 class Review(BaseModel):
@@ -11,3 +11,17 @@ class ReviewsResponse(BaseModel):
     place_id: str
     review_count: int
     reviews: List[Review]
+
+class StoredReview(BaseModel):
+    review_id: int
+    nickname: str
+    content: str
+    date: str
+    revisit: str
+    is_revisit: bool
+
+class StoredReviewsResponse(BaseModel):
+    place_id: str
+    review_count: int
+    reviews: List[StoredReview]
+    next_cursor: Optional[str] = None
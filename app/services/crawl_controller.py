@@ -0,0 +1,272 @@
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Dict, List, Optional
+
+from redis.exceptions import RedisError
+
+from app.config import (
+    CRAWL_AIMD_INITIAL_LIMIT,
+    CRAWL_AIMD_MIN_LIMIT,
+    CRAWL_AIMD_MAX_LIMIT,
+    CRAWL_AIMD_DECREASE_FACTOR,
+    CRAWL_BREAKER_THRESHOLD,
+    CRAWL_BREAKER_BASE_BACKOFF,
+    CRAWL_BREAKER_MAX_BACKOFF,
+    CRAWL_SLOT_LEASE,
+    CRAWL_SLOT_MAX_WAIT,
+)
+from app.redis_client import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 네이버 차단/제한 페이지 문구
+BLOCK_MARKERS = (
+    "비정상적인 접근",
+    "일시적으로 제한",
+    "자동입력 방지",
+    "과도한 요청",
+    "captcha",
+    "Too Many Requests",
+)
+
+# 슬롯이 없을 때 재시도 간격 (초)
+_SLOT_RETRY_INTERVAL = 0.5
+# 동시에 실패한 요청들로 한도가 연쇄 감소하지 않도록 하는 감소 간격 (크롤링 1회 소요 시간 정도)
+_DECREASE_COOLDOWN_MS = 10 * 1000
+
+
+class CrawlUnavailable(Exception):
+    """지금은 크롤링할 수 없음 (요청 경로에서는 main의 예외 핸들러가 503으로 응답)"""
+    status_code = 503
+    detail = "크롤링 요청이 많아 잠시 후 다시 시도해주세요."
+
+    def __init__(self):
+        super().__init__(self.detail)
+
+
+class CrawlSlotTimeout(CrawlUnavailable):
+    """대기 시간 내 크롤링 슬롯 획득 실패"""
+
+
+class CrawlBlocked(CrawlUnavailable):
+    """네이버 차단/제한 페이지 응답"""
+    detail = "네이버 요청이 일시적으로 제한되어 잠시 후 다시 시도해주세요."
+
+
+class CrawlOutcome(str, Enum):
+    """크롤링 결과 분류"""
+    OK = "ok"
+    EMPTY = "empty"
+    BLOCKED = "blocked"
+    TIMEOUT = "timeout"
+
+
+def classify_crawl_outcome(html: Optional[str], items: List, error: Optional[Exception] = None) -> CrawlOutcome:
+    # 크롤러 예외(페이지 로딩 타임아웃, 드라이버 오류)는 차단으로 단정하지 않고 timeout으로 분류
+    if error is not None:
+        return CrawlOutcome.TIMEOUT
+    if items:
+        return CrawlOutcome.OK
+    if html and any(marker in html for marker in BLOCK_MARKERS):
+        return CrawlOutcome.BLOCKED
+    return CrawlOutcome.EMPTY
+
+
+# KEYS[1]: 상태 해시, KEYS[2]: 실행 중 슬롯 (score = 임대 만료 시각)
+# ARGV: 슬롯 토큰, 가중치, 임대(ms), 초기 한도
+# 가중치는 현재 한도로 제한 (한도보다 큰 묶음이 실행 중인 작업이 0이 될 때까지 굶지 않도록)
+# return : {획득 여부, 재시도 대기(ms), 서킷 오픈 여부, 점유한 슬롯 수}
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local open_until = tonumber(redis.call('HGET', KEYS[1], 'open_until') or '0')
+if now < open_until then
+    return {0, open_until - now, 1}
+end
+
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+local limit = tonumber(redis.call('HGET', KEYS[1], 'limit') or ARGV[4])
+local weight = math.min(tonumber(ARGV[2]), math.max(1, math.floor(limit)))
+local running = redis.call('ZCARD', KEYS[2])
+if running + weight <= math.max(1, math.floor(limit)) then
+    for i = 1, weight do
+        redis.call('ZADD', KEYS[2], now + tonumber(ARGV[3]), ARGV[1] .. ':' .. i)
+    end
+    return {1, 0, 0, weight}
+end
+return {0, 0, 0, 0}
+"""
+
+# KEYS[1]: 상태 해시
+# ARGV: 결과, 초기/최소/최대 한도, 감소 비율, 차단 임계치, 기본/최대 백오프(ms), 감소 쿨다운(ms)
+_RECORD_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local outcome = ARGV[1]
+local limit = tonumber(redis.call('HGET', KEYS[1], 'limit') or ARGV[2])
+local min_limit = tonumber(ARGV[3])
+local max_limit = tonumber(ARGV[4])
+local streak = tonumber(redis.call('HGET', KEYS[1], 'block_streak') or '0')
+local level = tonumber(redis.call('HGET', KEYS[1], 'backoff_level') or '0')
+local last_decrease = tonumber(redis.call('HGET', KEYS[1], 'last_decrease') or '0')
+
+if outcome == 'ok' then
+    -- additive increase: 한도만큼 성공하면 +1
+    limit = math.min(max_limit, limit + 1 / limit)
+    streak = 0
+    level = 0
+elseif outcome == 'blocked' or outcome == 'timeout' then
+    -- multiplicative decrease (쿨다운 내 중복 감소 방지)
+    if now - last_decrease >= tonumber(ARGV[9]) then
+        limit = math.max(min_limit, limit * tonumber(ARGV[5]))
+        redis.call('HSET', KEYS[1], 'last_decrease', now)
+    end
+    if outcome == 'blocked' then
+        streak = streak + 1
+        if streak >= tonumber(ARGV[6]) then
+            local backoff = math.min(tonumber(ARGV[8]), tonumber(ARGV[7]) * math.pow(2, level))
+            redis.call('HSET', KEYS[1], 'open_until', now + backoff)
+            level = level + 1
+            streak = 0
+            limit = min_limit
+        end
+    end
+end
+
+redis.call('HSET', KEYS[1], 'limit', tostring(limit), 'block_streak', streak, 'backoff_level', level)
+return tostring(limit)
+"""
+
+
+class AdaptiveCrawlController:
+    """
+    pcmap.place.naver.com 크롤링 동시성 제어 (AIMD + 서킷 브레이커)
+
+    정상 응답이 이어지면 허용 동시 크롤링 수를 조금씩 늘리고, 차단/타임아웃이 발생하면
+    절반으로 줄인다. 차단이 연속되면 서킷을 열어 지수 백오프 동안 크롤링을 중단한다.
+    상태는 Redis에 저장되어 모든 레플리카가 공유하며, Redis 장애 시에는 허용(fail-open)한다.
+    """
+
+    def __init__(self, name: str = "crawl"):
+        self.state_key = f"{name}:aimd"
+        self.inflight_key = f"{name}:aimd:inflight"
+
+    async def try_acquire(self, token: str, weight: int = 1) -> Optional[float]:
+        """
+        슬롯 획득 시도
+
+        return : 획득 시 None, 실패 시 재시도까지 대기 시간(초)
+        """
+        redis_client = await get_async_redis_client()
+        result = await redis_client.eval_script(
+            _ACQUIRE_SCRIPT,
+            keys=[self.state_key, self.inflight_key],
+            args=[token, weight, CRAWL_SLOT_LEASE * 1000, CRAWL_AIMD_INITIAL_LIMIT],
+        )
+        if result is None:
+            return None
+
+        acquired, wait_ms = int(result[0]), int(result[1])
+        if acquired:
+            return None
+        return max(wait_ms / 1000, _SLOT_RETRY_INTERVAL)
+
+    async def release(self, token: str, weight: int = 1) -> None:
+        redis_client = await get_async_redis_client()
+        client = await redis_client.get_client()
+        await client.zrem(self.inflight_key, *(f"{token}:{i}" for i in range(1, weight + 1)))
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        weight: int = 1,
+        max_wait: float = CRAWL_SLOT_MAX_WAIT,
+        local: Optional[asyncio.Semaphore] = None,
+    ):
+        """
+        크롤링 슬롯 점유 (브라우저 탭 수만큼 weight 지정, 현재 한도보다 크면 한도만큼만 점유)
+
+        local이 주어지면 프로세스 내 세마포어도 함께 점유하되, 공유 슬롯을 기다리는 동안에는
+        내려놓아 다른 크롤링이 세마포어를 쓸 수 있게 한다.
+        max_wait초 안에 슬롯을 얻지 못하면 CrawlSlotTimeout
+        """
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + max_wait
+        while True:
+            if local is not None:
+                await local.acquire()
+            try:
+                wait = await self.try_acquire(token, weight)
+            except BaseException:
+                if local is not None:
+                    local.release()
+                raise
+            if wait is None:
+                break
+            if local is not None:
+                local.release()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CrawlSlotTimeout()
+            await asyncio.sleep(min(wait, remaining))
+
+        try:
+            yield
+        finally:
+            if local is not None:
+                local.release()
+            try:
+                await self.release(token, weight)
+            except Exception as e:
+                # 해제 실패 시에도 임대 만료로 회수됨
+                logger.warning(f"크롤링 슬롯 해제 실패 - error: {e}")
+
+    async def record(self, outcome: CrawlOutcome) -> None:
+        redis_client = await get_async_redis_client()
+        limit = await redis_client.eval_script(
+            _RECORD_SCRIPT,
+            keys=[self.state_key],
+            args=[
+                outcome.value,
+                CRAWL_AIMD_INITIAL_LIMIT,
+                CRAWL_AIMD_MIN_LIMIT,
+                CRAWL_AIMD_MAX_LIMIT,
+                CRAWL_AIMD_DECREASE_FACTOR,
+                CRAWL_BREAKER_THRESHOLD,
+                CRAWL_BREAKER_BASE_BACKOFF * 1000,
+                CRAWL_BREAKER_MAX_BACKOFF * 1000,
+                _DECREASE_COOLDOWN_MS,
+            ],
+        )
+        if outcome != CrawlOutcome.OK:
+            logger.warning(f"크롤링 결과 {outcome.value} - 동시 크롤링 한도: {limit}")
+
+    async def status(self) -> Dict:
+        """공유 상태 조회 (Redis 장애 시 기본값과 redis_available=False 반환)"""
+        redis_client = await get_async_redis_client()
+        now_ms = int(time.time() * 1000)
+        try:
+            client = await redis_client.get_client()
+            state = await client.hgetall(self.state_key)
+            running = await client.zcount(self.inflight_key, now_ms, "+inf")
+            available = True
+        except RedisError as e:
+            logger.warning(f"크롤링 동시성 상태 조회 실패 - error: {e}")
+            state, running, available = {}, 0, False
+        open_until = int(state.get("open_until", 0))
+        return {
+            "limit": float(state.get("limit", CRAWL_AIMD_INITIAL_LIMIT)),
+            "running": running,
+            "block_streak": int(state.get("block_streak", 0)),
+            "backoff_level": int(state.get("backoff_level", 0)),
+            "circuit_open": open_until > now_ms,
+            "circuit_open_seconds": max(0, (open_until - now_ms) // 1000),
+            "redis_available": available,
+        }
+
+
+crawl_controller = AdaptiveCrawlController()
@@ -0,0 +1,145 @@
+import asyncio
+import itertools
+import logging
+import math
+from typing import AsyncIterator, Dict, List, Tuple, Union
+
+import httpx
+from fastapi import HTTPException
+
+from app.config import (
+    NAVER_CLIENT_ID,
+    NAVER_CLIENT_SECRET,
+    NAVER_CREDENTIALS,
+    NAVER_OPENAPI_RATE_PER_SEC,
+    NAVER_OPENAPI_BURST,
+    NAVER_OPENAPI_DAILY_QUOTA,
+    NAVER_OPENAPI_MAX_WAIT,
+    LOCAL_SEARCH_QUERY_SUFFIXES,
+)
+from app.utils.rate_limiter import RedisTokenBucketLimiter
+
+logger = logging.getLogger(__name__)
+
+LOCAL_SEARCH_URL = "https://openapi.naver.com/v1/search/local.json"
+# 지역 검색 API 1회 최대 결과 수 (start는 1만 허용되어 페이지를 넘길 수 없음)
+LOCAL_SEARCH_MAX_DISPLAY = 5
+LOCAL_SEARCH_SORTS = ("random", "comment")
+
+
+def _load_credentials() -> List[Tuple[str, str]]:
+    credentials = []
+    for pair in NAVER_CREDENTIALS.split(","):
+        client_id, _, client_secret = pair.strip().partition(":")
+        if client_id and client_secret:
+            credentials.append((client_id, client_secret))
+    if not credentials:
+        credentials.append((NAVER_CLIENT_ID, NAVER_CLIENT_SECRET))
+    return credentials
+
+
+_credentials: Dict[str, str] = dict(_load_credentials())
+# 요청마다 시작 키를 바꿔 키 세트 간 부하 분산
+_rotation = itertools.cycle(range(len(_credentials)))
+
+openapi_limiter = RedisTokenBucketLimiter(
+    "naver_openapi",
+    rate=NAVER_OPENAPI_RATE_PER_SEC,
+    capacity=NAVER_OPENAPI_BURST,
+    daily_quota=NAVER_OPENAPI_DAILY_QUOTA,
+)
+
+
+def mask_client_id(client_id: str) -> str:
+    return f"{client_id[:4]}***" if client_id else ""
+
+
+async def search_local(query: str, display: int, start: int, sort: str) -> Dict:
+    """
+    네이버 지역 검색 Open API 호출
+
+    키 세트별 분산 토큰 버킷으로 호출량을 제한하며, 토큰이 부족하면
+    NAVER_OPENAPI_MAX_WAIT초까지 대기한다. 429 응답을 받은 키는 건너뛰고
+    다음 키 세트로 재시도한다.
+    """
+    client_ids = list(_credentials)
+    offset = next(_rotation)
+    candidates = client_ids[offset:] + client_ids[:offset]
+    params = {"query": query, "display": display, "start": start, "sort": sort}
+
+    while candidates:
+        client_id = await openapi_limiter.acquire_any(candidates, NAVER_OPENAPI_MAX_WAIT)
+        if client_id is None:
+            break
+
+        headers = {
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": _credentials[client_id],
+        }
+        async with httpx.AsyncClient() as client:
+            resp = await client.get(LOCAL_SEARCH_URL, headers=headers, params=params)
+
+        if resp.status_code == 429:
+            logger.warning(f"Open API 호출 한도 초과 - client_id: {mask_client_id(client_id)}")
+            candidates.remove(client_id)
+            continue
+        if resp.status_code != 200:
+            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+        return resp.json()
+
+    raise HTTPException(status_code=429, detail="Open API 호출 한도를 초과했습니다. 잠시 후 다시 시도해주세요.")
+
+
+def local_search_variants(query: str, size: int, sort: str) -> List[Dict[str, str]]:
+    """
+    size건을 모으는 데 필요한 (검색어, 정렬) 조합
+
+    지역 검색 API는 start 1 / display 5로 제한되어 같은 검색어로는 5건 이상 받을 수 없으므로
+    요청한 정렬 -> 다른 정렬 -> 검색어 + 접미어(LOCAL_SEARCH_QUERY_SUFFIXES, 설정한 경우만) 순으로 넓힌다.
+    """
+    sorts = [sort, *(other for other in LOCAL_SEARCH_SORTS if other != sort)]
+    suffixes = [suffix.strip() for suffix in LOCAL_SEARCH_QUERY_SUFFIXES.split(",") if suffix.strip()]
+    queries = [query, *(f"{query} {suffix}" for suffix in suffixes)]
+    variants = [{"query": q, "sort": s} for q in queries for s in sorts]
+    return variants[:math.ceil(size / LOCAL_SEARCH_MAX_DISPLAY)]
+
+
+async def search_local_variants(
+    query: str, size: int, sort: str
+) -> AsyncIterator[Tuple[Dict[str, str], Union[Dict, HTTPException]]]:
+    """
+    local_search_variants의 조합을 동시에 요청하고 완료되는 순서대로 반환 (조합마다 start 1, 5건)
+
+    각 요청은 search_local의 분산 토큰 버킷을 그대로 거치므로 동시 요청도 호출 한도 내에서 실행된다.
+    실패한 요청은 예외를 결과로 반환하여 나머지 요청은 계속 받을 수 있게 한다.
+    호출자가 순회를 중단하면 남은 요청은 취소된다.
+
+    return : ({"query", "sort"}, 검색 결과 또는 HTTPException)
+    """
+    async def fetch(variant: Dict[str, str]) -> Tuple[Dict[str, str], Union[Dict, HTTPException]]:
+        try:
+            return variant, await search_local(variant["query"], LOCAL_SEARCH_MAX_DISPLAY, 1, variant["sort"])
+        except HTTPException as e:
+            return variant, e
+        except httpx.HTTPError as e:
+            return variant, HTTPException(status_code=502, detail=f"Open API 호출 실패: {e}")
+        except Exception as e:
+            # JSON 디코딩 실패 등도 해당 요청만 실패로 처리하고 스트림은 계속
+            logger.warning(f"지역 검색 실패 - variant: {variant}, error: {e}")
+            return variant, HTTPException(status_code=502, detail=f"Open API 응답 처리 실패: {e}")
+
+    tasks = [asyncio.create_task(fetch(variant)) for variant in local_search_variants(query, size, sort)]
+    try:
+        for done in asyncio.as_completed(tasks):
+            yield await done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def get_quota_status() -> List[Dict]:
+    """키 세트별 남은 호출량"""
+    return [
+        {"client_id": mask_client_id(client_id), **await openapi_limiter.status(client_id)}
+        for client_id in _credentials
+    ]
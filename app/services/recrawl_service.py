@@ -0,0 +1,59 @@
+import math
+from datetime import datetime
+from typing import List, Optional
+
+from app.config import (
+    RECRAWL_MIN_INTERVAL_HOURS,
+    RECRAWL_MAX_INTERVAL_HOURS,
+    RECRAWL_MIN_EXPECTED_REVIEWS,
+)
+from app.models.models import Store
+
+# 속도 추정치가 없는 매장(재수집 이력 없음)의 기본 리뷰 증가 속도 (하루 1건)
+DEFAULT_REVIEW_VELOCITY = 1 / 24
+
+
+def hours_since_crawl(store: Store, now: datetime) -> float:
+    if store.last_crawled_at is None:
+        return math.inf
+    return max(0.0, (now - store.last_crawled_at).total_seconds() / 3600)
+
+
+def expected_new_reviews(store: Store, now: datetime) -> float:
+    """마지막 수집 이후 쌓였을 것으로 예상되는 신규 리뷰 수"""
+    velocity = store.review_velocity if store.review_velocity is not None else DEFAULT_REVIEW_VELOCITY
+    hours = hours_since_crawl(store, now)
+    return math.inf if math.isinf(hours) else velocity * hours
+
+
+def is_overdue(store: Store, now: datetime) -> bool:
+    return hours_since_crawl(store, now) >= RECRAWL_MAX_INTERVAL_HOURS
+
+
+def is_due(store: Store, now: datetime) -> bool:
+    """
+    재수집 필요 여부
+
+    - 최소 간격(기본 1시간) 이내면 제외
+    - 최대 간격(기본 7일)이 지났으면 무조건 대상
+    - 그 사이에는 예상 신규 리뷰 수가 임계치 이상일 때만 대상
+    """
+    hours = hours_since_crawl(store, now)
+    if hours < RECRAWL_MIN_INTERVAL_HOURS:
+        return False
+    if hours >= RECRAWL_MAX_INTERVAL_HOURS:
+        return True
+    return expected_new_reviews(store, now) >= RECRAWL_MIN_EXPECTED_REVIEWS
+
+
+def select_due_stores(stores: List[Store], now: datetime, limit: Optional[int] = None) -> List[Store]:
+    """
+    재수집 대상 매장을 우선순위 순으로 선택
+
+    크롤링 1회의 브라우저 사용 시간은 매장과 무관하게 비슷하므로, 예상 신규 리뷰 수가 큰
+    매장부터 수집해야 브라우저 시간 대비 신선도가 가장 크게 오른다.
+    최대 간격을 넘긴 매장은 리뷰가 적어도 밀리지 않도록 가장 먼저 수집한다.
+    """
+    due = [store for store in stores if is_due(store, now)]
+    due.sort(key=lambda store: (not is_overdue(store, now), -expected_new_reviews(store, now)))
+    return due if limit is None else due[:limit]
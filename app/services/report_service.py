@@ -0,0 +1,52 @@
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer
+
+from app.models.models import Store, Report
+
+# 요청 시에만 로딩하는 대용량 JSON 컬럼
+DETAIL_FIELDS = ("popular_keywords", "analytics_result")
+
+
+def report_to_dict(report: Report, include_details: bool = False) -> Dict:
+    data = {
+        "report_id": report.report_id,
+        "store_id": report.store_id,
+        "request_member_id": report.request_member_id,
+        "average_review_rate": report.average_review_rate,
+        "total_review_count": report.total_review_count,
+        "created_at": report.created_at.isoformat() if report.created_at else None,
+    }
+    if include_details:
+        for field in DETAIL_FIELDS:
+            data[field] = getattr(report, field)
+    return data
+
+
+def get_latest_report(session: Session, store_id: int, include_details: bool = False) -> Optional[Report]:
+    """
+    매장의 최신 보고서 조회
+
+    (store_id, created_at) 인덱스를 역순으로 한 건만 읽으며,
+    include_details가 False이면 JSON 컬럼은 SELECT 하지 않는다.
+    """
+    stmt = (
+        select(Report)
+        .where(Report.store_id == store_id)
+        .order_by(Report.created_at.desc(), Report.report_id.desc())
+        .limit(1)
+    )
+    if include_details:
+        stmt = stmt.options(*(undefer(getattr(Report, field)) for field in DETAIL_FIELDS))
+    return session.scalar(stmt)
+
+
+def find_store_id_by_name(session: Session, name: str) -> Optional[int]:
+    # 동명 매장이 여러 개인 경우 최근 갱신된 매장 기준
+    return session.scalar(
+        select(Store.store_id)
+        .where(Store.name == name)
+        .order_by(Store.updated_at.desc())
+        .limit(1)
+    )
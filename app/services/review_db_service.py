@@ -0,0 +1,207 @@
+import base64
+import hashlib
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+
+from sqlalchemy import select, or_, and_
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.models.models import Store, Review
+
+logger = logging.getLogger(__name__)
+
+# INSERT 한 번에 묶을 최대 행 수 (max_allowed_packet 여유 확보)
+INSERT_CHUNK_SIZE = 500
+
+# pcmap 방문일 표기: "7.15.화" (올해) 또는 "24.7.15.화" (이전 연도)
+_VISIT_DATE_RE = re.compile(r"^(?:(\d{2})\.)?(\d{1,2})\.(\d{1,2})")
+# 방문 횟수 표기: "2번째 방문"
+_REVISIT_RE = re.compile(r"(\d+)\s*번째")
+
+# 리뷰 증가 속도 EWMA 가중치 / 최소 관측 간격(시간)
+VELOCITY_ALPHA = 0.3
+_MIN_VELOCITY_WINDOW_HOURS = 1 / 60
+
+
+def review_content_hash(place_id: str, review: Dict, visit_date: date) -> str:
+    # pcmap은 올해 리뷰를 "12.20.금", 이전 연도 리뷰를 "24.12.20.금"으로 표기하므로
+    # 해가 바뀌어도 같은 값이 나오도록 표기 문자열 대신 정규화한 방문일로 해시
+    raw = "\x1f".join([
+        place_id,
+        review.get("nickname", ""),
+        visit_date.isoformat(),
+        review.get("content", ""),
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def parse_visit_date(text: str, today: Optional[date] = None) -> Optional[date]:
+    """
+    pcmap 방문일 표기를 날짜로 변환
+
+    return : 방문일, 알 수 없는 형식이면 None
+    """
+    today = today or date.today()
+    m = _VISIT_DATE_RE.match(text or "")
+    if not m:
+        return None
+
+    year, month, day = m.groups()
+    try:
+        if year:
+            return date(2000 + int(year), int(month), int(day))
+        visited = date(today.year, int(month), int(day))
+    except ValueError:
+        return None
+
+    # 연도 표기가 없는데 미래 날짜이면 작년 리뷰
+    if visited > today:
+        visited = visited.replace(year=today.year - 1)
+    return visited
+
+
+def is_revisit(text: str) -> bool:
+    m = _REVISIT_RE.search(text or "")
+    return bool(m) and int(m.group(1)) > 1
+
+
+def get_store_by_place_id(session: Session, place_id: str) -> Optional[Store]:
+    return session.scalar(select(Store).where(Store.place_id == place_id))
+
+
+def get_or_create_store(session: Session, place_id: str, name: Optional[str] = None) -> Store:
+    store = get_store_by_place_id(session, place_id)
+    if store is None:
+        # 상호명을 모르는 경우(place_id 직접 조회) place_id로 대체
+        store = Store(place_id=place_id, name=name or place_id)
+        session.add(store)
+        session.flush()
+    elif name and store.name == place_id:
+        store.name = name
+    return store
+
+
+def save_reviews(session: Session, store_id: int, place_id: str, reviews: List[Dict]) -> int:
+    """
+    reviews_parser 결과를 review 테이블에 INSERT IGNORE로 일괄 저장
+
+    content_hash 유니크 키에 걸리는 (이미 저장된) 리뷰는 무시되므로
+    같은 매장을 반복 크롤링해도 새로운 리뷰만 기록된다.
+    방문일을 알 수 없는 리뷰는 (store_id, visit_date) 정렬을 흐트러뜨리지 않도록 저장하지 않는다.
+
+    return : 새로 저장된 리뷰 수
+    """
+    today = date.today()
+    rows: Dict[str, Dict] = {}
+    for review in reviews:
+        visit_date = parse_visit_date(review.get("date", ""), today)
+        if visit_date is None:
+            logger.warning(f"방문일 파싱 실패로 리뷰 제외 - place_id: {place_id}, date: {review.get('date')!r}")
+            continue
+        content_hash = review_content_hash(place_id, review, visit_date)
+        rows[content_hash] = {
+            "store_id": store_id,
+            "content_hash": content_hash,
+            "nickname": review.get("nickname", "")[:100],
+            "content": review.get("content", ""),
+            "visit_date": visit_date,
+            "revisit": review.get("revisit", "")[:50],
+            "is_revisit": is_revisit(review.get("revisit", "")),
+        }
+
+    values = list(rows.values())
+    if not values:
+        return 0
+    inserted = 0
+    for i in range(0, len(values), INSERT_CHUNK_SIZE):
+        stmt = insert(Review).prefix_with("IGNORE").values(values[i:i + INSERT_CHUNK_SIZE])
+        inserted += session.execute(stmt).rowcount
+    return inserted
+
+
+def update_review_velocity(store: Store, inserted: int, now: datetime) -> None:
+    """
+    직전 수집 이후 신규 리뷰 수로 시간당 리뷰 증가 속도(EWMA) 갱신
+
+    첫 수집은 과거 리뷰가 한 번에 들어오므로 속도 추정에 사용하지 않는다.
+    """
+    if store.last_crawled_at is None:
+        return
+    hours = max((now - store.last_crawled_at).total_seconds() / 3600, _MIN_VELOCITY_WINDOW_HOURS)
+    rate = inserted / hours
+    if store.review_velocity is None:
+        store.review_velocity = rate
+    else:
+        store.review_velocity = VELOCITY_ALPHA * rate + (1 - VELOCITY_ALPHA) * store.review_velocity
+
+
+def list_tracked_stores(session: Session) -> List[Store]:
+    return list(session.scalars(select(Store).where(Store.is_tracked.is_(True))))
+
+
+def set_store_tracking(session: Session, store_id: int, tracked: bool) -> bool:
+    store = session.get(Store, store_id)
+    if store is None or store.place_id is None:
+        return False
+    store.is_tracked = tracked
+    return True
+
+
+def is_stale(store: Optional[Store], stale_minutes: int) -> bool:
+    if store is None or store.last_crawled_at is None:
+        return True
+    return store.last_crawled_at < datetime.now() - timedelta(minutes=stale_minutes)
+
+
+def encode_cursor(visit_date: date, review_id: int) -> str:
+    raw = f"{visit_date.isoformat()}:{review_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """잘못된 커서는 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        visit_date, review_id = raw.split(":")
+        return date.fromisoformat(visit_date), int(review_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def fetch_stored_reviews(
+    session: Session,
+    store_id: int,
+    size: int,
+    cursor: Optional[str] = None,
+    revisit_only: bool = False,
+) -> Tuple[List[Review], Optional[str]]:
+    """
+    저장된 리뷰를 (visit_date, review_id) 내림차순 키셋 페이지네이션으로 조회
+
+    (store_id, visit_date) 인덱스는 InnoDB 특성상 PK(review_id)를 포함하므로
+    OFFSET 없이 커서 위치부터 인덱스 범위 스캔만 수행한다.
+
+    return : (리뷰 목록, 다음 페이지 커서 또는 None)
+    """
+    stmt = select(Review).where(Review.store_id == store_id)
+    if revisit_only:
+        stmt = stmt.where(Review.is_revisit.is_(True))
+    if cursor:
+        last_date, last_id = decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            Review.visit_date < last_date,
+            and_(Review.visit_date == last_date, Review.review_id < last_id),
+        ))
+    stmt = stmt.order_by(Review.visit_date.desc(), Review.review_id.desc()).limit(size + 1)
+
+    rows = list(session.scalars(stmt))
+    if len(rows) <= size:
+        return rows, None
+
+    rows = rows[:size]
+    last = rows[-1]
+    return rows, encode_cursor(last.visit_date, last.review_id)
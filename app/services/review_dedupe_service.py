@@ -0,0 +1,177 @@
+import re
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.config import (
+    REVIEW_DEDUPE_THRESHOLD,
+    REVIEW_DEDUPE_NUM_PERM,
+    REVIEW_DEDUPE_SHINGLE_SIZE,
+    REVIEW_DEDUPE_MIN_LENGTH,
+)
+
+# 공백/문장부호/이모지 제거 (한글·영문·숫자만 비교)
+_NON_WORD_RE = re.compile(r"[\W_]+")
+# 문자 코드 롤링 해시 계수 (홀수)
+_SHINGLE_PRIME = np.uint64(1099511628211)
+# MinHash 한 번에 계산할 최대 원소 수 (순열 수 × shingle 수), 메모리 사용량 제한
+_MINHASH_BLOCK_ELEMENTS = 1 << 22
+# 이 크기 이하 버킷은 모든 쌍을 후보로 비교, 더 큰 버킷(템플릿 리뷰 등)은 대표와만 비교
+_BUCKET_PAIRWISE_MAX = 32
+
+
+def normalize_content(text: str) -> str:
+    return _NON_WORD_RE.sub("", (text or "").lower())
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    밴드 수 b, 밴드당 행 수 r 선택 (b * r == num_perm)
+
+    후보가 되는 유사도 경계 (1/b)^(1/r)가 threshold 이하인 조합 중 가장 높은 것.
+    후보 쌍은 서명으로 다시 검증하므로 경계를 낮게 잡아 놓치는 쌍을 줄인다.
+    """
+    candidates = [(num_perm // r, r) for r in range(1, num_perm + 1) if num_perm % r == 0]
+    boundary = lambda br: (1 / br[0]) ** (1 / br[1])
+    below = [br for br in candidates if boundary(br) <= threshold]
+    return max(below, key=boundary) if below else min(candidates, key=boundary)
+
+
+def _shingle_hashes(texts: Sequence[str], k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    전체 텍스트의 문자 k-gram 해시를 한 배열로 계산
+
+    return : (shingle 해시 배열, 텍스트별 시작 위치)
+    k보다 짧은 텍스트는 0으로 채워 shingle 1개로 취급한다.
+    """
+    codes = [np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32) for text in texts]
+    lengths = np.array([max(len(c), k) for c in codes], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    corpus = np.zeros(int(lengths.sum()), dtype=np.uint64)
+    for start, c in zip(starts, codes):
+        corpus[start:start + len(c)] = c
+
+    # 텍스트 경계를 넘지 않는 시작 위치만 사용
+    counts = lengths - k + 1
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    positions = np.arange(int(counts.sum()), dtype=np.int64) + np.repeat(starts - offsets, counts)
+
+    hashes = np.zeros(len(positions), dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * _SHINGLE_PRIME + corpus[positions + j]
+    return hashes, offsets
+
+
+def minhash_signatures(texts: Sequence[str], num_perm: int, shingle_size: int, seed: int = 1) -> np.ndarray:
+    """
+    MinHash 서명 (텍스트 수 × num_perm, uint32)
+
+    순열은 multiply-shift 해시 ((a * x + b) mod 2^64) >> 32 로 근사하고,
+    텍스트별 최솟값은 np.minimum.reduceat으로 한 번에 구한다.
+    """
+    return _signatures(*_shingle_hashes(texts, shingle_size), len(texts), num_perm, seed)
+
+
+def _signatures(hashes: np.ndarray, offsets: np.ndarray, n: int, num_perm: int, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    signatures = np.empty((n, num_perm), dtype=np.uint32)
+    block = max(1, _MINHASH_BLOCK_ELEMENTS // max(1, len(hashes)))
+    for i in range(0, num_perm, block):
+        permuted = (a[i:i + block, None] * hashes[None, :] + b[i:i + block, None]) >> np.uint64(32)
+        signatures[:, i:i + block] = np.minimum.reduceat(permuted, offsets, axis=1).T
+    return signatures
+
+
+def _exact_similarity(hashes: np.ndarray, offsets: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """후보 쌍의 정확한 Jaccard 유사도 (shingle 해시 집합 기준, 후보에 등장한 텍스트만 집합 생성)"""
+    ends = np.append(offsets[1:], len(hashes))
+    shingles = {i: set(hashes[offsets[i]:ends[i]].tolist()) for i in np.unique(pairs).tolist()}
+    return np.array([
+        len(shingles[i] & shingles[j]) / len(shingles[i] | shingles[j]) for i, j in pairs.tolist()
+    ])
+
+
+def _find(parent: List[int], i: int) -> int:
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def find_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = REVIEW_DEDUPE_THRESHOLD,
+    num_perm: int = REVIEW_DEDUPE_NUM_PERM,
+    shingle_size: int = REVIEW_DEDUPE_SHINGLE_SIZE,
+    min_length: int = REVIEW_DEDUPE_MIN_LENGTH,
+) -> np.ndarray:
+    """
+    MinHash LSH 기반 유사 중복 군집화
+
+    밴드별 해시가 같은 텍스트를 버킷으로 묶어 버킷 안의 쌍을 후보로 삼고, 추정 Jaccard 유사도가
+    threshold 이상이면 같은 군집으로 합친다. 작은 버킷(_BUCKET_PAIRWISE_MAX 이하)은 모든 쌍을 비교하고
+    큰 버킷은 버킷 대표(가장 앞선 텍스트)와만 비교하여 후보 수가 거의 선형으로 유지된다.
+    (대표와만 비교하면 A~B, B~C는 유사하지만 A~C가 임계치 미만일 때 B~C 쌍을 놓친다)
+    후보 쌍은 서명 추정치 대신 shingle 집합의 정확한 Jaccard로 검증한다. 128개 순열 추정치의 표준편차가
+    약 0.035라 임계치 근처 쌍의 절반가량이 추정치로는 탈락하기 때문이다.
+    정규화 후 min_length보다 짧은 텍스트("맛있어요" 등)는 흔한 표현이므로 중복으로 보지 않는다.
+
+    return : 텍스트별 군집 대표 인덱스 (자기 자신이면 대표, 아니면 중복)
+    """
+    n = len(texts)
+    labels = np.arange(n)
+    normalized = [normalize_content(text) for text in texts]
+    eligible = np.array([i for i, text in enumerate(normalized) if len(text) >= min_length], dtype=np.int64)
+    if len(eligible) < 2:
+        return labels
+
+    hashes, offsets = _shingle_hashes([normalized[i] for i in eligible], shingle_size)
+    signatures = _signatures(hashes, offsets, len(eligible), num_perm)
+    bands, rows = lsh_params(threshold, num_perm)
+    m = len(eligible)
+
+    pairs = []
+    for band in range(bands):
+        keys = np.zeros(m, dtype=np.uint64)
+        for column in signatures[:, band * rows:(band + 1) * rows].T:
+            keys = keys * _SHINGLE_PRIME + column.astype(np.uint64)
+        _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        for bucket in np.flatnonzero(counts >= 2).tolist():
+            members = order[bounds[bucket]:bounds[bucket + 1]]
+            if len(members) <= _BUCKET_PAIRWISE_MAX:
+                left, right = np.triu_indices(len(members), k=1)
+                pairs.append(np.stack([members[left], members[right]], axis=1))
+            else:
+                pairs.append(np.stack([members[1:], np.full(len(members) - 1, members[0])], axis=1))
+
+    if not pairs:
+        return labels
+    candidates = np.unique(np.concatenate(pairs), axis=0)
+    similarity = _exact_similarity(hashes, offsets, candidates)
+    matched = candidates[similarity >= threshold]
+
+    parent = list(range(m))
+    for i, j in matched.tolist():
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i != root_j:
+            # 앞선 텍스트가 군집 대표가 되도록 작은 인덱스를 루트로
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    roots = np.array([_find(parent, i) for i in range(m)])
+    labels[eligible] = eligible[roots]
+    return labels
+
+
+def dedupe_reviews(reviews: List[Dict]) -> List[Dict]:
+    """유사 중복/템플릿 리뷰를 제외한 리뷰 (군집별 가장 앞선 리뷰만 유지)"""
+    if len(reviews) < 2:
+        return list(reviews)
+    labels = find_near_duplicates([review.get("content", "") for review in reviews])
+    return [review for i, review in enumerate(reviews) if labels[i] == i]
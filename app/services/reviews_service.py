@@ -10,15 +10,20 @@ from selenium.webdriver.common.keys import Keys
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+# 멀티탭 크롤링 시 '더보기' 대기 시간 (탭을 순회하는 동안 이미 로딩이 끝나므로 짧게 유지)
+TAB_CLICK_WAIT = 2
+
 # (7/7) pcmap URL 기준
 # review_sort가 일부 case에서 적용 불가능한 것으로 보여
 # 파라미터 적용 임시 비활성화 (최신순 적용)
 
-def reviews_fetch(place_id: str, max_clicks: int) -> str:
+def _review_url(place_id: str) -> str:
     # place_id URI 인코딩
     enc_id = urllib.parse.quote_plus(place_id)
-    url = f"https://pcmap.place.naver.com/place/{enc_id}/review/visitor"
+    return f"https://pcmap.place.naver.com/place/{enc_id}/review/visitor"
+
 
+def _create_driver() -> webdriver.Chrome:
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
@@ -29,7 +34,12 @@ def reviews_fetch(place_id: str, max_clicks: int) -> str:
         "Chrome/88.0.4324.93 Mobile Safari/537.36"
     )
     service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    return webdriver.Chrome(service=service, options=options)
+
+
+def reviews_fetch(place_id: str, max_clicks: int) -> str:
+    url = _review_url(place_id)
+    driver = _create_driver()
 
     try:
         driver.get(url)
@@ -56,6 +66,70 @@ def reviews_fetch(place_id: str, max_clicks: int) -> str:
         driver.quit()
 
 
+def reviews_fetch_many(place_ids: List[str], max_clicks: int) -> Dict[str, str]:
+    """
+    브라우저 하나에 place_id별 탭을 열어 리뷰 페이지를 동시에 크롤링
+
+    각 탭은 window.open으로 병렬 로딩하고, '더보기' 클릭은 탭을 순회하며
+    라운드로빈으로 진행한다. 한 탭의 추가 로딩을 기다리는 동안 다른 탭을 클릭하므로
+    탭 수가 늘어나도 대기 시간은 거의 늘지 않는다.
+
+    return : {place_id: page_source}
+    """
+    place_ids = list(dict.fromkeys(place_ids))
+    if not place_ids:
+        return {}
+
+    driver = _create_driver()
+
+    try:
+        # 탭 열기 (첫 탭은 기본 창 사용)
+        handles: Dict[str, str] = {}
+        for i, place_id in enumerate(place_ids):
+            if i == 0:
+                driver.get(_review_url(place_id))
+                handles[place_id] = driver.current_window_handle
+                continue
+            before = set(driver.window_handles)
+            driver.execute_script("window.open(arguments[0], '_blank');", _review_url(place_id))
+            handles[place_id] = (set(driver.window_handles) - before).pop()
+
+        # 탭별 첫 페이지 스크롤 (로딩 대기)
+        driver.implicitly_wait(10)
+        for handle in handles.values():
+            driver.switch_to.window(handle)
+            driver.find_element(By.TAG_NAME, "body").send_keys(Keys.PAGE_DOWN)
+        time.sleep(0.5)
+
+        # '더보기' 버튼 라운드로빈 클릭
+        driver.implicitly_wait(TAB_CLICK_WAIT)
+        active = list(handles.values())
+        for _ in range(max_clicks):
+            if not active:
+                break
+            remaining = []
+            for handle in active:
+                driver.switch_to.window(handle)
+                try:
+                    btn = driver.find_element(By.XPATH, '//a[contains(text(),"더보기")]')
+                    btn.click()
+                    remaining.append(handle)
+                except:
+                    pass
+            active = remaining
+            time.sleep(0.5)
+
+        time.sleep(1)
+        pages: Dict[str, str] = {}
+        for place_id, handle in handles.items():
+            driver.switch_to.window(handle)
+            pages[place_id] = driver.page_source
+        return pages
+
+    finally:
+        driver.quit()
+
+
 def reviews_parser(html: str) -> List[Dict]:
     soup = BeautifulSoup(html, "lxml")
 
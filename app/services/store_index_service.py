@@ -0,0 +1,107 @@
+import html
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from app.models.models import Store
+
+# 지역 검색 결과 title의 검색어 강조 태그
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def clean_text(text: Optional[str]) -> str:
+    """<b> 태그와 HTML 엔티티 제거 후 공백 정리"""
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub("", text or ""))).strip()
+
+
+def store_key(title: str, road_address: Optional[str]) -> str:
+    """
+    매장 식별 키 (상호명 + 도로명 주소)
+
+    같은 매장이 검색어에 따라 다른 강조 태그/공백으로 내려와도 같은 키가 되도록 정규화한다.
+    """
+    return f"{clean_text(title).lower()}|{clean_text(road_address).lower()}"
+
+
+def search_item_to_store(item: Dict) -> Optional[Dict]:
+    """지역 검색 결과 항목을 인덱스/DB 저장용 값으로 변환 (좌표 없으면 None)"""
+    try:
+        mapx, mapy = int(item["mapx"]), int(item["mapy"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    # 컬럼 길이에 맞춰 자른 값으로 키를 만들어 DB 재로딩 시에도 같은 키가 되도록 함
+    name = clean_text(item.get("title"))[:100]
+    address = (clean_text(item.get("roadAddress")) or clean_text(item.get("address")))[:200]
+    if not name or not (mapx and mapy):
+        return None
+    return {
+        "key": store_key(name, address),
+        "name": name,
+        "address": address,
+        "category": clean_text(item.get("category"))[:50],
+        "mapx": mapx,
+        "mapy": mapy,
+        "store_id": None,
+        "place_id": None,
+    }
+
+
+def store_to_dict(store: Store) -> Dict:
+    return {
+        "key": store_key(store.name, store.address),
+        "name": store.name,
+        "address": store.address or "",
+        "category": store.category or "",
+        "mapx": store.mapx,
+        "mapy": store.mapy,
+        "store_id": store.store_id,
+        "place_id": store.place_id,
+    }
+
+
+def upsert_searched_stores(session: Session, stores: List[Dict]) -> List[Store]:
+    """
+    검색 결과 매장 일괄 저장
+
+    (상호명, 주소) 유니크 키로 INSERT ... ON DUPLICATE KEY UPDATE 한 번에 저장하고 좌표/카테고리를 갱신한다.
+    주소가 정확히 같은 매장만 같은 매장으로 보므로, 주소 없이 리뷰 수집으로만 생성된 매장이나
+    상호명만 같은 다른 지점에는 반영하지 않는다.
+    """
+    rows = {(data["name"], data["address"]): data for data in stores}
+    if not rows:
+        return []
+    stmt = insert(Store).values([
+        {
+            "name": data["name"],
+            "address": data["address"],
+            "category": data["category"] or None,
+            "mapx": data["mapx"],
+            "mapy": data["mapy"],
+        }
+        for data in rows.values()
+    ])
+    session.execute(stmt.on_duplicate_key_update(
+        category=func.coalesce(stmt.inserted.category, Store.category),
+        mapx=stmt.inserted.mapx,
+        mapy=stmt.inserted.mapy,
+        # ON DUPLICATE KEY UPDATE에는 컬럼 onupdate가 적용되지 않음 (증분 로딩 기준)
+        updated_at=func.now(),
+    ))
+    return list(session.scalars(select(Store).where(tuple_(Store.name, Store.address).in_(list(rows)))))
+
+
+def load_located_stores(session: Session, since: Optional[datetime] = None) -> List[Store]:
+    """
+    좌표가 있는 매장 조회 (since 이후 수정분만)
+
+    updated_at은 초 단위이므로 같은 초의 수정분을 놓치지 않도록 경계를 포함한다.
+    """
+    query = select(Store).where(Store.mapx.is_not(None), Store.mapy.is_not(None))
+    if since is not None:
+        query = query.where(Store.updated_at >= since)
+    return list(session.scalars(query))
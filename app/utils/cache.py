@@ -0,0 +1,21 @@
+# Redis 캐시 키 네임스페이스
+REVIEWS_NAMESPACE = "reviews"
+REPORTS_NAMESPACE = "report"
+PLACE_ID_NAMESPACE = "place_id"
+
+# 관리 API로 무효화 가능한 캐시 네임스페이스
+CACHE_NAMESPACES = (REVIEWS_NAMESPACE, REPORTS_NAMESPACE, PLACE_ID_NAMESPACE)
+
+
+def build_cache_key(namespace: str, *parts) -> str:
+    """네임스페이스 기반 캐시 키 생성 (예: reviews:1997987484:first)"""
+    return ":".join([namespace, *(str(part) for part in parts)])
+
+
+def build_key_index(namespace: str, *parts) -> str:
+    """
+    같은 대상의 캐시 키 목록을 담는 인덱스 Set 키 (예: reviews:1997987484:keys)
+
+    AsyncRedisClient.set_tracked / unlink_tracked와 함께 사용한다.
+    """
+    return build_cache_key(namespace, *parts, "keys")
@@ -0,0 +1,88 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Tuple
+
+# 조회 결과가 없음을 나타내는 값 (None 값 캐싱과 구분)
+MISS = object()
+
+
+class NearCache:
+    """
+    프로세스 내 LRU + TTL 캐시 (AsyncRedisClient 니어 캐시용)
+
+    디코딩된 값을 그대로 보관하므로 반환된 객체를 수정하면 안 된다.
+    invalidate 시 generation을 증가시켜, 조회 도중 무효화된 값이 다시 저장되지 않도록 한다.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, prefixes: Tuple[str, ...] = ()):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.prefixes = prefixes
+        self.generation = 0
+        # key -> (만료 시각, 값, 원본 크기(bytes))
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def accepts(self, key: str) -> bool:
+        return not self.prefixes or key.startswith(self.prefixes)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISS
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return MISS
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, size: int, generation: int) -> None:
+        # 조회 시작 이후 무효화가 있었다면 저장하지 않음
+        if generation != self.generation:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        self.generation += 1
+        for key in keys:
+            if self._remove(key):
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[2]
+        return True
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "approx_bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
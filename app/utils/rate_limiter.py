@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from redis.exceptions import RedisError
+
+from app.redis_client import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: 토큰 버킷 해시, KEYS[2]: 일일 사용량 카운터
+# ARGV: 초당 충전량, 버킷 크기, 일일 한도(0이면 무제한), 일일 카운터 TTL(초)
+# return : {허용 여부(1/0, 일일 한도 초과 시 -1), 다음 토큰까지 대기(ms), 오늘 사용량}
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local quota = tonumber(ARGV[3])
+local used = tonumber(redis.call('GET', KEYS[2]) or '0')
+if quota > 0 and used >= quota then
+    return {-1, 0, used}
+end
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+    used = redis.call('INCR', KEYS[2])
+    if used == 1 then
+        redis.call('EXPIRE', KEYS[2], ARGV[4])
+    end
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return {allowed, wait, used}
+"""
+
+# 일일 카운터는 자정(KST) 기준으로 키가 바뀌므로 TTL은 여유 있게 설정
+_DAILY_KEY_TTL = 2 * 24 * 60 * 60
+
+
+class RedisTokenBucketLimiter:
+    """
+    Redis 기반 분산 토큰 버킷 (모든 워커/레플리카가 공유)
+
+    버킷 상태와 일일 사용량은 키(자격 증명)별로 관리된다.
+    Redis 장애 시에는 서비스 중단을 막기 위해 허용(fail-open)한다.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: int, daily_quota: int = 0):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.daily_quota = daily_quota
+
+    def _bucket_key(self, key: str) -> str:
+        return f"ratelimit:{self.name}:{key}:bucket"
+
+    def _daily_key(self, key: str) -> str:
+        return f"ratelimit:{self.name}:{key}:quota:{datetime.now().strftime('%Y%m%d')}"
+
+    async def try_acquire(self, key: str) -> Tuple[bool, float, bool]:
+        """
+        토큰 1개 획득 시도 (대기 없음)
+
+        return : (획득 여부, 다음 토큰까지 대기 시간(초), 일일 한도 초과 여부)
+        """
+        redis_client = await get_async_redis_client()
+        result = await redis_client.eval_script(
+            _TOKEN_BUCKET_SCRIPT,
+            keys=[self._bucket_key(key), self._daily_key(key)],
+            args=[self.rate, self.capacity, self.daily_quota, _DAILY_KEY_TTL],
+        )
+        if result is None:
+            return True, 0.0, False
+
+        allowed, wait_ms, _ = (int(v) for v in result)
+        if allowed < 0:
+            return False, 0.0, True
+        return allowed == 1, wait_ms / 1000, False
+
+    async def acquire_any(self, keys: List[str], max_wait: float) -> Optional[str]:
+        """
+        여러 키 중 토큰이 남은 키 하나를 획득 (부족하면 최대 max_wait초 대기)
+
+        return : 획득한 키, 대기 시간 내 획득 실패 시 None
+        """
+        deadline = time.monotonic() + max_wait
+        candidates = list(keys)
+        while candidates:
+            waits = []
+            for key in list(candidates):
+                allowed, wait, exhausted = await self.try_acquire(key)
+                if allowed:
+                    return key
+                if exhausted:
+                    candidates.remove(key)
+                else:
+                    waits.append(wait)
+
+            remaining = deadline - time.monotonic()
+            if not waits or remaining <= 0:
+                break
+            await asyncio.sleep(min(min(waits), remaining))
+        return None
+
+    async def status(self, key: str) -> Dict:
+        """키별 남은 토큰 및 일일 한도 사용 현황 (Redis 장애 시 가득 찬 버킷과 redis_available=False 반환)"""
+        redis_client = await get_async_redis_client()
+        try:
+            client = await redis_client.get_client()
+            tokens, ts = await client.hmget(self._bucket_key(key), "tokens", "ts")
+            used = int(await client.get(self._daily_key(key)) or 0)
+            redis_available = True
+        except RedisError as e:
+            logger.warning(f"토큰 버킷 상태 조회 실패 - name: {self.name}, error: {e}")
+            tokens, ts, used, redis_available = None, None, 0, False
+
+        if tokens is None:
+            available = float(self.capacity)
+        else:
+            elapsed = max(0.0, time.time() * 1000 - float(ts))
+            available = min(float(self.capacity), float(tokens) + elapsed * self.rate / 1000)
+
+        return {
+            "available_tokens": round(available, 2),
+            "capacity": self.capacity,
+            "rate_per_sec": self.rate,
+            "daily_quota": self.daily_quota,
+            "daily_used": used,
+            "daily_remaining": max(0, self.daily_quota - used) if self.daily_quota else None,
+            "redis_available": redis_available,
+        }
@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+
+from app.redis_client import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 토큰이 일치할 때만 임대 연장 / 해제
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 결과 대기 중 폴링 간격 (초, 최소에서 시작해 최대까지 2배씩)
+_POLL_MIN_INTERVAL = 0.2
+_POLL_MAX_INTERVAL = 1.0
+
+
+class _LeaderGone(Exception):
+    """결과 발행 없이 락이 사라짐 (리더 프로세스 종료 등)"""
+
+
+class RedisSingleFlight:
+    """
+    레플리카 간 single-flight 실행
+
+    같은 키의 작업은 Redis 락(임대 + 주기적 연장)을 잡은 리더 하나만 실행하고,
+    나머지 호출자는 리더가 기록하는 결과 키를 폴링하여 받아 사용한다.
+    (대기자마다 pub/sub 연결을 점유하면 크기가 작은 연결 풀이 고갈되므로 폴링을 사용)
+    같은 프로세스 내 중복 호출은 하나의 Task를 공유한다.
+    """
+
+    def __init__(self, namespace: str, lease: int, result_ttl: int, wait_timeout: int):
+        self.namespace = namespace
+        self.lease_ms = lease * 1000
+        self.result_ttl = result_ttl
+        self.wait_timeout = wait_timeout
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.namespace}:lock:{key}"
+
+    def _result_key(self, key: str) -> str:
+        return f"{self.namespace}:result:{key}"
+
+    async def acquire(self, key: str) -> Optional[str]:
+        """락 획득 시도. 성공 시 토큰 반환"""
+        redis_client = await get_async_redis_client()
+        token = uuid.uuid4().hex
+        try:
+            client = await redis_client.get_client()
+            acquired = await client.set(self._lock_key(key), token, px=self.lease_ms, nx=True)
+        except RedisError as e:
+            # Redis 장애 시 락 없이 진행 (fail-open)
+            logger.warning(f"single-flight 락 획득 실패, 락 없이 진행 - key: {key}, error: {e}")
+            return token
+        return token if acquired else None
+
+    @asynccontextmanager
+    async def renewing(self, leases: Dict[str, str]):
+        """작업 동안 락 임대를 주기적으로 연장"""
+        redis_client = await get_async_redis_client()
+
+        async def renew():
+            while True:
+                await asyncio.sleep(self.lease_ms / 3000)
+                for key, token in leases.items():
+                    await redis_client.eval_script(
+                        _RENEW_SCRIPT, keys=[self._lock_key(key)], args=[token, self.lease_ms]
+                    )
+
+        task = asyncio.create_task(renew())
+        try:
+            yield
+        finally:
+            task.cancel()
+
+    async def complete(self, key: str, token: str, result: Any = None, error: Optional[Exception] = None) -> None:
+        """결과(또는 오류)를 결과 키에 기록한 뒤 락 해제"""
+        redis_client = await get_async_redis_client()
+        if error is None:
+            payload = {"ok": True, "result": result}
+        else:
+            payload = {
+                "ok": False,
+                "status_code": getattr(error, "status_code", None),
+                "error": str(getattr(error, "detail", error)),
+            }
+
+        try:
+            await redis_client.set(self._result_key(key), payload, ex=self.result_ttl)
+        except Exception as e:
+            logger.warning(f"single-flight 결과 기록 실패 - key: {key}, error: {e}")
+        finally:
+            await redis_client.eval_script(_RELEASE_SCRIPT, keys=[self._lock_key(key)], args=[token])
+
+    async def wait(self, key: str) -> Any:
+        """
+        리더의 결과 대기 (결과 키 폴링, 대기 중 연결을 점유하지 않음)
+
+        리더가 결과 없이 사라지면 _LeaderGone
+        """
+        redis_client = await get_async_redis_client()
+        deadline = time.monotonic() + self.wait_timeout
+        interval = _POLL_MIN_INTERVAL
+        while True:
+            payload = await redis_client.get(self._result_key(key))
+            if payload is not None:
+                break
+            if not await redis_client.exists(self._lock_key(key)):
+                # 락 해제와 결과 기록 사이 경합 방지를 위해 한 번 더 확인
+                payload = await redis_client.get(self._result_key(key))
+                if payload is None:
+                    raise _LeaderGone(key)
+                break
+            if time.monotonic() > deadline:
+                raise HTTPException(status_code=504, detail="동일 요청의 크롤링 결과 대기 시간이 초과되었습니다.")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, _POLL_MAX_INTERVAL)
+
+        if payload["ok"]:
+            return payload["result"]
+        raise HTTPException(status_code=payload.get("status_code") or 502, detail=payload["error"])
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key 단위 single-flight 실행
+
+        fn 결과는 JSON 직렬화 가능해야 한다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            token = await self.acquire(key)
+            if token is not None:
+                return await self.lead(key, token, fn)
+            try:
+                return await self.wait(key)
+            except _LeaderGone:
+                logger.warning(f"single-flight 리더 소실, 재시도 - key: {key}")
+
+    async def lead(self, key: str, token: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """락을 잡은 상태에서 fn 실행 후 결과 발행"""
+        async with self.renewing({key: token}):
+            try:
+                result = await fn()
+            except Exception as e:
+                await self.complete(key, token, error=e)
+                raise
+        await self.complete(key, token, result)
+        return result
+
+    async def acquire_many(self, keys: List[str]) -> Dict[str, str]:
+        """여러 키의 락을 시도하여 획득한 키와 토큰만 반환"""
+        tokens = await asyncio.gather(*(self.acquire(key) for key in keys))
+        return {key: token for key, token in zip(keys, tokens) if token is not None}
@@ -0,0 +1,160 @@
+import heapq
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# 좌표 단위: 네이버 지역 검색 mapx/mapy (WGS84 경위도 × 10^7)
+COORD_SCALE = 10_000_000
+# 위도 1도의 거리 (m)
+_METERS_PER_DEGREE = 111_320
+
+
+class SpatialPoint:
+    __slots__ = ("key", "x", "y", "category", "payload")
+
+    def __init__(self, key: str, x: int, y: int, category: str, payload: Any):
+        self.key = key
+        self.x = x
+        self.y = y
+        self.category = category
+        self.payload = payload
+
+
+class GridSpatialIndex:
+    """
+    균일 격자 기반 메모리 공간 인덱스
+
+    좌표를 cell_size(도) 크기 격자에 나누어 담고, 질의 범위와 겹치는 격자만 확인한다.
+    거리는 등장방형 근사(수십 km 이내 오차 무시 가능)로 계산한다.
+    이벤트 루프에서만 수정/조회하는 것을 전제로 하며 별도 락은 두지 않는다.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = max(1, int(cell_size * COORD_SCALE))
+        self._cells: Dict[Tuple[int, int], Dict[str, SpatialPoint]] = {}
+        self._points: Dict[str, SpatialPoint] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def get(self, key: str) -> Optional[SpatialPoint]:
+        return self._points.get(key)
+
+    def _cell(self, x: int, y: int) -> Tuple[int, int]:
+        return x // self.cell_size, y // self.cell_size
+
+    def upsert(self, key: str, x: int, y: int, category: str, payload: Any) -> None:
+        self.remove(key)
+        point = SpatialPoint(key, x, y, category or "", payload)
+        self._points[key] = point
+        self._cells.setdefault(self._cell(x, y), {})[key] = point
+
+    def remove(self, key: str) -> bool:
+        point = self._points.pop(key, None)
+        if point is None:
+            return False
+        cell = self._cell(point.x, point.y)
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+        return True
+
+    def _scan(self, min_x: int, min_y: int, max_x: int, max_y: int) -> Iterator[SpatialPoint]:
+        min_cx, min_cy = self._cell(min_x, min_y)
+        max_cx, max_cy = self._cell(max_x, max_y)
+        # 범위가 매우 넓으면 격자 순회보다 비어 있지 않은 격자만 보는 편이 빠름
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+            cells = (
+                bucket for (cx, cy), bucket in self._cells.items()
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy
+            )
+        else:
+            cells = (
+                self._cells.get((cx, cy))
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)
+            )
+        for bucket in cells:
+            if bucket:
+                yield from bucket.values()
+
+    def bbox(
+        self,
+        min_x: int,
+        min_y: int,
+        max_x: int,
+        max_y: int,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[SpatialPoint]:
+        """사각 영역 내 좌표 (category는 부분 일치)"""
+        results = []
+        for point in self._scan(min_x, min_y, max_x, max_y):
+            if not (min_x <= point.x <= max_x and min_y <= point.y <= max_y):
+                continue
+            if category and category not in point.category:
+                continue
+            results.append(point)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def radius(
+        self,
+        x: int,
+        y: int,
+        meters: float,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[float, SpatialPoint]]:
+        """
+        중심 좌표 반경 내 좌표를 가까운 순으로 반환
+
+        return : [(거리(m), 좌표), ...]
+        """
+        meters_per_unit_y = _METERS_PER_DEGREE / COORD_SCALE
+        meters_per_unit_x = meters_per_unit_y * math.cos(math.radians(y / COORD_SCALE))
+        dx = int(meters / meters_per_unit_x) + 1
+        dy = int(meters / meters_per_unit_y) + 1
+        max_sq = meters * meters
+
+        def distance_sq(point: SpatialPoint) -> float:
+            ex = (point.x - x) * meters_per_unit_x
+            ey = (point.y - y) * meters_per_unit_y
+            return ex * ex + ey * ey
+
+        def collect(points: Iterator[SpatialPoint], results: List[Tuple[float, SpatialPoint]]) -> None:
+            for point in points:
+                d = distance_sq(point)
+                if d <= max_sq and (not category or category in point.category):
+                    results.append((d, point))
+
+        results: List[Tuple[float, SpatialPoint]] = []
+        min_cx, min_cy = self._cell(x - dx, y - dy)
+        max_cx, max_cy = self._cell(x + dx, y + dy)
+        if limit is None or (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+            collect(self._scan(x - dx, y - dy, x + dx, y + dy), results)
+            results.sort(key=lambda item: item[0])
+            if limit is not None:
+                results = results[:limit]
+            return [(math.sqrt(d), point) for d, point in results]
+
+        # 중심 격자부터 고리 모양으로 넓혀 가며 탐색하고, limit개를 찾았고 다음 고리가
+        # 그보다 멀면 중단 (반경이 넓어도 가까운 매장만 보면 되는 경우가 대부분)
+        cx, cy = self._cell(x, y)
+        cell_meters = self.cell_size * min(meters_per_unit_x, meters_per_unit_y)
+        for ring in range(max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy) + 1):
+            for ix in range(max(min_cx, cx - ring), min(max_cx, cx + ring) + 1):
+                edge = ix in (cx - ring, cx + ring)
+                for iy in range(max(min_cy, cy - ring), min(max_cy, cy + ring) + 1):
+                    if edge or iy in (cy - ring, cy + ring):
+                        bucket = self._cells.get((ix, iy))
+                        if bucket:
+                            collect(iter(bucket.values()), results)
+            if len(results) >= limit:
+                results = heapq.nsmallest(limit, results, key=lambda item: item[0])
+                # 다음 고리의 좌표는 중심에서 최소 ring * cell_meters 이상 떨어져 있음
+                if results[-1][0] <= (ring * cell_meters) ** 2:
+                    break
+        results = heapq.nsmallest(limit, results, key=lambda item: item[0])
+        return [(math.sqrt(d), point) for d, point in results]
@@ -0,0 +1,120 @@
+"""
+리뷰 유사 중복 제거(MinHash LSH) 벤치마크
+
+실행 : python -m benchmarks.review_dedupe_bench [리뷰 수 ...]
+
+합성 리뷰에 템플릿/복붙 리뷰를 섞어 처리 시간과 오탐 수(심어 둔 중복이 아닌데 중복 판정)를 측정한다.
+심어 둔 중복 중 짧은 리뷰는 변형 후 실제 유사도가 임계치 아래일 수 있으므로, 작은 규모에서는
+전체 쌍 비교(O(n^2), 정확한 Jaccard)를 기준으로 재현율과 시간을 함께 비교한다.
+(n=1000/2000 기준 recall_vs_exact 약 0.99, 놓치는 쌍은 LSH 후보 경계(약 0.71) 근처 확률적 누락)
+"""
+import random
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from app.config import REVIEW_DEDUPE_THRESHOLD, REVIEW_DEDUPE_SHINGLE_SIZE, REVIEW_DEDUPE_MIN_LENGTH
+from app.services.review_dedupe_service import find_near_duplicates, normalize_content
+
+_WORDS = (
+    "맛있어요 분위기 좋아요 친절해요 재방문 의사 있어요 양이 많아요 가성비 최고 웨이팅 길어요 "
+    "주차 편해요 커피 디저트 파스타 국물 진하고 고기 부드러워요 매장 깔끔해요 사장님 직원분 "
+    "추천합니다 다음에 또 올게요 데이트 가족 모임 점심 저녁 메뉴 다양해요 조용해서 좋았어요"
+).split()
+
+_TEMPLATES = (
+    "체험단으로 방문했는데 음식이 정말 맛있고 사장님이 친절하셔서 기분 좋게 식사했습니다 강력 추천합니다",
+    "이벤트 참여 리뷰입니다 매장이 깔끔하고 메뉴가 다양해서 가족 모임 장소로 딱이에요 다음에 또 올게요",
+    "리뷰 작성하면 음료 서비스 준다고 해서 남겨요 커피 맛있고 디저트도 괜찮아요 분위기 좋아요",
+)
+
+
+def _mutate(text: str, rng: random.Random) -> str:
+    # 템플릿 리뷰에 흔한 소폭 변형: 단어 하나 교체 또는 문장부호/이모지 추가
+    words = text.split()
+    words[rng.randrange(len(words))] = rng.choice(_WORDS)
+    return " ".join(words) + rng.choice(("", "!", "!!", " ^^", " 👍"))
+
+
+def generate_reviews(n: int, duplicate_ratio: float = 0.2, seed: int = 7) -> Tuple[List[str], List[int]]:
+    """
+    return : (리뷰 목록, 군집 번호) — 같은 템플릿/원문에서 나온 리뷰는 같은 군집 번호
+    """
+    rng = random.Random(seed)
+    texts, groups = [], []
+    originals = []
+    for i in range(n):
+        if rng.random() < duplicate_ratio:
+            if originals and rng.random() < 0.5:
+                group, text = rng.choice(originals)
+            else:
+                group = -1 - rng.randrange(len(_TEMPLATES))
+                text = _TEMPLATES[-1 - group]
+            texts.append(_mutate(text, rng))
+            groups.append(group)
+        else:
+            text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 30)))
+            originals.append((i, text))
+            texts.append(text)
+            groups.append(i)
+    return texts, groups
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def pairwise_duplicates(texts: List[str], threshold: float) -> np.ndarray:
+    """전체 쌍 비교 기준 중복 여부 (앞선 리뷰와 정확한 Jaccard 유사도가 threshold 이상)"""
+    k = REVIEW_DEDUPE_SHINGLE_SIZE
+    shingles = []
+    for text in map(normalize_content, texts):
+        if len(text) < REVIEW_DEDUPE_MIN_LENGTH:
+            shingles.append(None)
+        else:
+            shingles.append({text[i:i + k] for i in range(len(text) - k + 1)})
+    duplicates = np.zeros(len(texts), dtype=bool)
+    for i, current in enumerate(shingles):
+        duplicates[i] = current is not None and any(
+            prev is not None and _jaccard(current, prev) >= threshold for prev in shingles[:i]
+        )
+    return duplicates
+
+
+def run(n: int, compare_pairwise: bool) -> None:
+    texts, groups = generate_reviews(n)
+    started = time.perf_counter()
+    labels = find_near_duplicates(texts)
+    elapsed = time.perf_counter() - started
+
+    groups = np.array(groups)
+    flagged = labels != np.arange(n)
+    # 같은 군집에서 두 번째 이후 리뷰 = 심어 둔 중복
+    planted = np.zeros(n, dtype=bool)
+    seen = set()
+    for i, group in enumerate(groups.tolist()):
+        planted[i] = group in seen
+        seen.add(group)
+    false_positive = int((flagged & ~planted).sum())
+
+    line = (
+        f"n={n:>6}  minhash-lsh={elapsed:7.3f}s  flagged={int(flagged.sum()):>6}  "
+        f"planted={int(planted.sum()):>6}  false_positive={false_positive}"
+    )
+    if compare_pairwise:
+        started = time.perf_counter()
+        exact = pairwise_duplicates(texts, REVIEW_DEDUPE_THRESHOLD)
+        recall = (flagged & exact).sum() / max(1, exact.sum())
+        line += (
+            f"  pairwise={time.perf_counter() - started:7.3f}s  exact={int(exact.sum())}  "
+            f"recall_vs_exact={recall:.3f}"
+        )
+    print(line)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 2_000, 10_000, 50_000]
+    for size in sizes:
+        run(size, compare_pairwise=size <= 2_000)
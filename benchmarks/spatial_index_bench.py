@@ -0,0 +1,58 @@
+"""
+매장 공간 인덱스(GridSpatialIndex) 벤치마크
+
+실행 : python -m benchmarks.spatial_index_bench [좌표 수 ...]
+
+서울 영역에 무작위 좌표를 넣고 반경/영역 질의 평균 시간을 측정한다.
+"""
+import random
+import sys
+import time
+
+from app.config import STORE_INDEX_CELL_SIZE
+from app.utils.spatial_index import COORD_SCALE, GridSpatialIndex
+
+# 서울 대략 범위 (경도, 위도)
+_MIN_X, _MAX_X = 126.76, 127.18
+_MIN_Y, _MAX_Y = 37.41, 37.70
+_CATEGORIES = ("카페,디저트>카페", "음식점>한식", "음식점>일식", "술집>요리주점", "음식점>양식")
+_QUERIES = 2_000
+
+
+def _coord(value: float) -> int:
+    return int(value * COORD_SCALE)
+
+
+def run(n: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    index = GridSpatialIndex(STORE_INDEX_CELL_SIZE)
+    started = time.perf_counter()
+    for i in range(n):
+        index.upsert(
+            f"store-{i}",
+            _coord(rng.uniform(_MIN_X, _MAX_X)),
+            _coord(rng.uniform(_MIN_Y, _MAX_Y)),
+            rng.choice(_CATEGORIES),
+            None,
+        )
+    build = time.perf_counter() - started
+
+    centers = [(_coord(rng.uniform(_MIN_X, _MAX_X)), _coord(rng.uniform(_MIN_Y, _MAX_Y))) for _ in range(_QUERIES)]
+    line = f"n={n:>7}  build={build:6.2f}s"
+    for label, query in (
+        ("radius500m", lambda x, y: index.radius(x, y, 500, limit=10)),
+        ("radius500m+cafe", lambda x, y: index.radius(x, y, 500, category="카페", limit=10)),
+        ("radius2km", lambda x, y: index.radius(x, y, 2_000, limit=10)),
+        ("bbox1km", lambda x, y: index.bbox(x - 56_000, y - 45_000, x + 56_000, y + 45_000, limit=100)),
+    ):
+        started = time.perf_counter()
+        found = sum(len(query(x, y)) for x, y in centers)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / _QUERIES
+        line += f"  {label}={elapsed_ms:.3f}ms(avg {found / _QUERIES:.1f})"
+    print(line)
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 300_000]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,19 @@
+-- 리뷰 영속화: store.place_id, review 테이블
+ALTER TABLE store
+    ADD COLUMN place_id VARCHAR(30) NULL COMMENT '네이버플레이스 ID' AFTER name,
+    ADD UNIQUE KEY uq_store_place_id (place_id);
+
+CREATE TABLE review (
+    review_id BIGINT NOT NULL AUTO_INCREMENT COMMENT '기본키',
+    store_id BIGINT NOT NULL COMMENT '매장 ID',
+    content_hash VARCHAR(64) NOT NULL COMMENT '(place_id, 닉네임, 방문일, 내용) SHA-256 해시',
+    nickname VARCHAR(100) NOT NULL DEFAULT '' COMMENT '작성자 닉네임',
+    content TEXT NOT NULL COMMENT '리뷰 내용',
+    visit_date DATE NOT NULL COMMENT '방문일',
+    revisit VARCHAR(50) NOT NULL DEFAULT '' COMMENT '방문 횟수 표기',
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '수집일시',
+    PRIMARY KEY (review_id),
+    UNIQUE KEY uq_review_content_hash (content_hash),
+    KEY ix_review_store_id_visit_date (store_id, visit_date),
+    CONSTRAINT fk_review_store_id FOREIGN KEY (store_id) REFERENCES store (store_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
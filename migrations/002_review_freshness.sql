@@ -0,0 +1,6 @@
+-- 저장된 리뷰 조회: 마지막 수집일시, 재방문 여부
+ALTER TABLE store
+    ADD COLUMN last_crawled_at DATETIME NULL COMMENT '마지막 리뷰 수집일시' AFTER store_image;
+
+ALTER TABLE review
+    ADD COLUMN is_revisit TINYINT(1) NOT NULL DEFAULT 0 COMMENT '재방문 여부' AFTER revisit;
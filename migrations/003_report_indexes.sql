@@ -0,0 +1,6 @@
+-- 최신 보고서 조회 / 상호명 조회 인덱스
+ALTER TABLE store
+    ADD KEY ix_store_name (name);
+
+ALTER TABLE report
+    ADD KEY ix_report_store_id_created_at (store_id, created_at);
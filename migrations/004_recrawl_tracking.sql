@@ -0,0 +1,5 @@
+-- 주기적 재수집: 추적 여부, 리뷰 증가 속도
+ALTER TABLE store
+    ADD COLUMN is_tracked TINYINT(1) NOT NULL DEFAULT 0 COMMENT '주기적 재수집 대상 여부' AFTER last_crawled_at,
+    ADD COLUMN review_velocity FLOAT NULL COMMENT '시간당 신규 리뷰 수 추정치 (EWMA)' AFTER is_tracked,
+    ADD KEY ix_store_is_tracked (is_tracked);
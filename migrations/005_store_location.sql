@@ -0,0 +1,5 @@
+-- 매장 공간 인덱스: 좌표, 증분 로딩용 수정일시 인덱스
+ALTER TABLE store
+    ADD COLUMN mapx INT NULL COMMENT '경도 (WGS84 × 10^7)' AFTER store_image,
+    ADD COLUMN mapy INT NULL COMMENT '위도 (WGS84 × 10^7)' AFTER mapx,
+    ADD KEY ix_store_updated_at (updated_at);
@@ -0,0 +1,5 @@
+-- 검색 결과 매장 저장: (상호명, 주소) 유니크 키 (INSERT ... ON DUPLICATE KEY UPDATE 대상)
+-- 적용 전 중복 행이 없어야 한다. 아래 조회 결과가 있으면 리뷰/보고서를 한 매장으로 옮긴 뒤 나머지를 삭제한다.
+--   SELECT name, address, COUNT(*) FROM store WHERE address IS NOT NULL GROUP BY name, address HAVING COUNT(*) > 1;
+ALTER TABLE store
+    ADD UNIQUE KEY uq_store_name_address (name, address);
@@ -0,0 +1,19 @@
+import fakeredis
+import pytest
+
+from app import redis_client as redis_module
+from app.redis_client import AsyncRedisClient
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """fakeredis(Lua 포함)에 연결된 AsyncRedisClient를 싱글톤으로 등록"""
+    server = fakeredis.FakeServer()
+
+    async def initialize(self):
+        self._client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+    monkeypatch.setattr(AsyncRedisClient, "_initialize_client", initialize)
+    client = AsyncRedisClient()
+    monkeypatch.setattr(redis_module, "_async_redis_client", client)
+    return client
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.application import review_application_service
+from app.application.review_application_service import ReviewApplicationService, crawl_key
+from app.config import CRAWL_AIMD_INITIAL_LIMIT, CRAWL_AIMD_MIN_LIMIT, CRAWL_BREAKER_THRESHOLD
+from app.services.crawl_controller import (
+    AdaptiveCrawlController,
+    CrawlBlocked,
+    CrawlOutcome,
+    CrawlSlotTimeout,
+    classify_crawl_outcome,
+)
+
+
+@pytest.mark.parametrize(
+    "html, items, error, expected",
+    [
+        ("<html/>", [{"content": "x"}], None, CrawlOutcome.OK),
+        ("<html/>", [], None, CrawlOutcome.EMPTY),
+        ("비정상적인 접근이 감지되었습니다", [], None, CrawlOutcome.BLOCKED),
+        (None, [], TimeoutError(), CrawlOutcome.TIMEOUT),
+    ],
+)
+def test_classify_crawl_outcome(html, items, error, expected):
+    assert classify_crawl_outcome(html, items, error) == expected
+
+
+def test_slot_weight_capped_at_limit(redis_client):
+    controller = AdaptiveCrawlController("test")
+
+    async def scenario():
+        # 한도(기본 4)보다 큰 묶음도 한도만큼만 점유하고 바로 시작
+        async with controller.slot(weight=int(CRAWL_AIMD_INITIAL_LIMIT) + 1):
+            running = (await controller.status())["running"]
+            blocked = await controller.try_acquire("other")
+        return running, blocked, (await controller.status())["running"]
+
+    running, blocked, after = asyncio.run(scenario())
+    assert running == int(CRAWL_AIMD_INITIAL_LIMIT)
+    assert blocked is not None
+    assert after == 0
+
+
+def test_slot_timeout_releases_local_semaphore(redis_client):
+    controller = AdaptiveCrawlController("test")
+    semaphore = asyncio.Semaphore(1)
+
+    async def scenario():
+        async with controller.slot(weight=int(CRAWL_AIMD_INITIAL_LIMIT)):
+            with pytest.raises(CrawlSlotTimeout):
+                async with controller.slot(max_wait=0.1, local=semaphore):
+                    pass
+        return semaphore.locked()
+
+    assert asyncio.run(scenario()) is False
+    assert CrawlSlotTimeout.status_code == CrawlBlocked.status_code == 503
+
+
+def test_aimd_decrease_and_increase(redis_client):
+    controller = AdaptiveCrawlController("test")
+
+    async def scenario():
+        await controller.record(CrawlOutcome.TIMEOUT)
+        decreased = (await controller.status())["limit"]
+        # 감소 쿨다운 안의 연속 실패는 한 번만 감소
+        await controller.record(CrawlOutcome.TIMEOUT)
+        cooled = (await controller.status())["limit"]
+        for _ in range(4):
+            await controller.record(CrawlOutcome.OK)
+        return decreased, cooled, (await controller.status())["limit"]
+
+    decreased, cooled, increased = asyncio.run(scenario())
+    assert decreased == CRAWL_AIMD_INITIAL_LIMIT / 2
+    assert cooled == decreased
+    assert decreased < increased <= decreased + 4 / decreased
+
+
+def test_breaker_opens_after_consecutive_blocks(redis_client):
+    controller = AdaptiveCrawlController("test")
+
+    async def scenario():
+        for _ in range(CRAWL_BREAKER_THRESHOLD):
+            await controller.record(CrawlOutcome.BLOCKED)
+        return await controller.status(), await controller.try_acquire("token")
+
+    status, wait = asyncio.run(scenario())
+    assert status["circuit_open"] and status["limit"] == CRAWL_AIMD_MIN_LIMIT
+    assert wait is not None and wait > 1
+
+
+def test_blocked_tab_is_published_as_error(redis_client, monkeypatch):
+    pages = {"111": "비정상적인 접근이 감지되었습니다", "222": "<li>리뷰</li>"}
+    monkeypatch.setattr(review_application_service, "reviews_fetch_many", lambda place_ids, more: pages)
+    monkeypatch.setattr(
+        review_application_service, "reviews_parser", lambda html: [{"content": "x"}] if "리뷰" in html else []
+    )
+    single_flight = review_application_service._review_single_flight
+
+    async def scenario():
+        crawled = await ReviewApplicationService().crawl_reviews_many(["111", "222"], 5)
+        # 같은 키를 기다리던 호출자(다른 레플리카 포함)는 결과 키로 차단을 전달받음
+        with pytest.raises(HTTPException) as e:
+            await single_flight.wait(crawl_key("111", 5))
+        return crawled, e.value.status_code, await single_flight.wait(crawl_key("222", 5))
+
+    crawled, status_code, waited = asyncio.run(scenario())
+    assert crawled == {"222": [{"content": "x"}]}
+    assert status_code == 503
+    assert waited == [{"content": "x"}]
@@ -0,0 +1,38 @@
+import asyncio
+
+from fastapi import HTTPException
+
+from app.services import local_search_service
+from app.services.local_search_service import local_search_variants
+
+
+def test_variants_default_to_sort_fan_out_only():
+    assert local_search_variants("정자동 카페", 50, "comment") == [
+        {"query": "정자동 카페", "sort": "comment"},
+        {"query": "정자동 카페", "sort": "random"},
+    ]
+
+
+def test_variants_with_suffixes_are_capped_by_size(monkeypatch):
+    monkeypatch.setattr(local_search_service, "LOCAL_SEARCH_QUERY_SUFFIXES", "맛집, ,추천")
+    assert local_search_variants("카페", 100, "random") == [
+        {"query": q, "sort": s} for q in ("카페", "카페 맛집", "카페 추천") for s in ("random", "comment")
+    ]
+    # 조합당 5건이므로 size 11건은 3개 조합
+    assert len(local_search_variants("카페", 11, "random")) == 3
+
+
+def test_failed_variant_is_returned_as_502(monkeypatch):
+    async def search_local(query, display, start, sort):
+        if sort == "comment":
+            raise ValueError("Expecting value")
+        return {"items": [{"title": query}]}
+
+    monkeypatch.setattr(local_search_service, "search_local", search_local)
+
+    async def scenario():
+        return {variant["sort"]: result async for variant, result in local_search_service.search_local_variants("카페", 10, "random")}
+
+    results = asyncio.run(scenario())
+    assert results["random"] == {"items": [{"title": "카페"}]}
+    assert isinstance(results["comment"], HTTPException) and results["comment"].status_code == 502
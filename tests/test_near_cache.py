@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+from app.utils.near_cache import MISS, NearCache
+
+
+def test_put_is_dropped_after_concurrent_invalidation():
+    cache = NearCache(max_entries=10, ttl=60, prefixes=("report:",))
+    # 조회 시작 시점의 generation으로 저장하는 동안 다른 쪽에서 무효화
+    generation = cache.generation
+    cache.invalidate(["report:1"])
+    cache.put("report:1", "stale", 5, generation)
+    assert cache.get("report:1") is MISS
+
+    cache.put("report:1", "fresh", 5, cache.generation)
+    assert cache.get("report:1") == "fresh"
+
+
+def test_clear_bumps_generation():
+    cache = NearCache(max_entries=10, ttl=60)
+    generation = cache.generation
+    cache.clear()
+    cache.put("k", 1, 1, generation)
+    assert cache.get("k") is MISS
+
+
+def test_lru_eviction_and_size_accounting():
+    cache = NearCache(max_entries=2, ttl=60)
+    cache.put("a", 1, 10, cache.generation)
+    cache.put("b", 2, 20, cache.generation)
+    cache.get("a")
+    cache.put("c", 3, 30, cache.generation)
+    assert cache.get("b") is MISS
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["approx_bytes"] == 40 and stats["evictions"] == 1
+
+
+def test_ttl_expiry(monkeypatch):
+    cache = NearCache(max_entries=10, ttl=5)
+    cache.put("k", 1, 1, cache.generation)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert cache.get("k") is MISS
+    assert cache.stats()["approx_bytes"] == 0
+
+
+def test_client_write_invalidates_near_cache(redis_client):
+    redis_client.enable_near_cache(max_entries=10, ttl=60, prefixes=("report:",))
+
+    async def scenario():
+        await redis_client.set("report:1", {"v": 1})
+        assert await redis_client.get("report:1") == {"v": 1}
+        assert await redis_client.get("report:1") == {"v": 1}
+        await redis_client.set("report:1", {"v": 2})
+        value = await redis_client.get("report:1")
+        await redis_client.close()
+        return value
+
+    assert asyncio.run(scenario()) == {"v": 2}
+    assert redis_client.near_cache_stats()["hits"] >= 1
@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.services import local_search_service
+from app.utils.rate_limiter import RedisTokenBucketLimiter
+
+
+def test_token_bucket_burst_then_wait(redis_client):
+    limiter = RedisTokenBucketLimiter("test", rate=1, capacity=3)
+
+    async def scenario():
+        return [await limiter.try_acquire("key") for _ in range(4)]
+
+    results = asyncio.run(scenario())
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    _, wait, exhausted = results[-1]
+    assert 0 < wait <= 1 and not exhausted
+
+
+def test_token_bucket_daily_quota(redis_client):
+    limiter = RedisTokenBucketLimiter("test", rate=100, capacity=100, daily_quota=2)
+
+    async def scenario():
+        results = [await limiter.try_acquire("key") for _ in range(3)]
+        other = await limiter.try_acquire("other")
+        return results, other, await limiter.status("key")
+
+    results, other, status = asyncio.run(scenario())
+    assert results[-1] == (False, 0.0, True)
+    # 일일 한도는 키(자격 증명)별
+    assert other[0]
+    assert status["daily_used"] == 2 and status["daily_remaining"] == 0 and status["redis_available"]
+
+
+def test_acquire_any_skips_exhausted_keys(redis_client):
+    limiter = RedisTokenBucketLimiter("test", rate=100, capacity=100, daily_quota=1)
+
+    async def scenario():
+        return [await limiter.acquire_any(["a", "b"], max_wait=0.1) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == ["a", "b", None]
+
+
+@pytest.fixture
+def openapi(monkeypatch, redis_client):
+    """키 세트 2개와 응답을 지정할 수 있는 가짜 Open API"""
+    responses = {}
+    requested = []
+
+    def handler(request):
+        client_id = request.headers["X-Naver-Client-Id"]
+        requested.append(client_id)
+        return httpx.Response(responses.get(client_id, 200), json={"items": [{"title": client_id}]})
+
+    transport = httpx.MockTransport(handler)
+    async_client = httpx.AsyncClient
+    monkeypatch.setattr(local_search_service, "_credentials", {"id-a": "secret-a", "id-b": "secret-b"})
+    monkeypatch.setattr(local_search_service, "_rotation", iter([0, 0, 0]))
+    monkeypatch.setattr(local_search_service.httpx, "AsyncClient", lambda: async_client(transport=transport))
+    return responses, requested
+
+
+def test_search_local_rotates_to_next_key_on_429(openapi):
+    responses, requested = openapi
+    responses["id-a"] = 429
+    result = asyncio.run(local_search_service.search_local("카페", 5, 1, "random"))
+    assert requested == ["id-a", "id-b"]
+    assert result["items"][0]["title"] == "id-b"
+
+
+def test_search_local_raises_429_when_every_key_is_limited(openapi):
+    responses, _ = openapi
+    responses.update({"id-a": 429, "id-b": 429})
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(local_search_service.search_local("카페", 5, 1, "random"))
+    assert e.value.status_code == 429
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from app.application.recrawl_scheduler import failure_backoff_seconds
+from app.config import RECRAWL_MAX_INTERVAL_HOURS, RECRAWL_MIN_INTERVAL_HOURS
+from app.models.models import Store
+from app.services.recrawl_service import is_due, select_due_stores
+
+NOW = datetime(2025, 7, 20, 12, 0)
+
+
+def store(store_id, hours_ago, velocity=None):
+    last_crawled_at = None if hours_ago is None else NOW - timedelta(hours=hours_ago)
+    return Store(store_id=store_id, name=str(store_id), last_crawled_at=last_crawled_at, review_velocity=velocity)
+
+
+def test_recently_crawled_store_is_not_due():
+    assert not is_due(store(1, 0.5, velocity=100), NOW)
+
+
+def test_slow_store_waits_for_expected_reviews():
+    # 하루 1건 페이스면 24시간 뒤에 기대 신규 리뷰 1건
+    assert not is_due(store(1, 12, velocity=1 / 24), NOW)
+    assert is_due(store(1, 25, velocity=1 / 24), NOW)
+
+
+def test_select_due_stores_orders_overdue_then_expected_reviews():
+    stores = [
+        store(1, 2, velocity=1.0),       # 기대 2건
+        store(2, 2, velocity=5.0),       # 기대 10건
+        store(3, 200, velocity=0.0),     # 최대 간격 초과
+        store(4, None),                  # 수집 이력 없음
+        store(5, 0.5, velocity=50.0),    # 최소 간격 이내
+        store(6, 10, velocity=0.01),     # 기대 0.1건
+    ]
+    due = select_due_stores(stores, NOW)
+    # 최대 간격 초과 매장이 먼저, 그 안에서도 기대 리뷰 수(이력 없음 = 무한대) 순
+    assert [s.store_id for s in due] == [4, 3, 2, 1]
+    assert [s.store_id for s in select_due_stores(stores, NOW, limit=2)] == [4, 3]
+
+
+def test_failure_backoff_doubles_up_to_max_interval():
+    assert failure_backoff_seconds(1) == RECRAWL_MIN_INTERVAL_HOURS * 3600
+    assert failure_backoff_seconds(2) == RECRAWL_MIN_INTERVAL_HOURS * 2 * 3600
+    assert failure_backoff_seconds(50) == RECRAWL_MAX_INTERVAL_HOURS * 3600
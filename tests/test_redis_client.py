@@ -0,0 +1,69 @@
+import asyncio
+
+from app.redis_client import escape_glob
+
+
+async def _keys(client, match="*"):
+    return sorted([key async for key in client.scan_iter(match)])
+
+
+def test_scan_iter_and_sscan_iter(redis_client):
+    async def scenario():
+        raw = await redis_client.get_client()
+        await raw.mset({"reviews:1": "a", "reviews:1:page:2": "b", "report:1": "c"})
+        await raw.sadd("index:1", "x", "y", "z")
+
+        assert await _keys(redis_client, "reviews:*") == ["reviews:1", "reviews:1:page:2"]
+        members = sorted([m async for m in redis_client.sscan_iter("index:1")])
+        assert members == ["x", "y", "z"]
+
+    asyncio.run(scenario())
+
+
+def test_delete_pattern_unlinks_in_batches(redis_client):
+    async def scenario():
+        raw = await redis_client.get_client()
+        await raw.mset({f"reviews:{i}": "v" for i in range(7)})
+        await raw.set("report:1", "keep")
+
+        assert await redis_client.delete_pattern("reviews:*", batch_size=3) == 7
+        assert await _keys(redis_client) == ["report:1"]
+
+    asyncio.run(scenario())
+
+
+def test_unlink_tracked_removes_keys_and_index(redis_client):
+    async def scenario():
+        for page in range(3):
+            assert await redis_client.set_tracked(f"reviews:1:page:{page}", {"page": page}, "idx:reviews:1", ex=60)
+        await redis_client.set("reviews:2:page:0", {"page": 0})
+
+        assert await redis_client.unlink_tracked("idx:reviews:1", batch_size=2) == 3
+        assert await _keys(redis_client) == ["reviews:2:page:0"]
+
+    asyncio.run(scenario())
+
+
+def test_invalidate_namespace_matches_prefix_literally(redis_client):
+    async def scenario():
+        raw = await redis_client.get_client()
+        await raw.mset({
+            "reviews:1": "a",
+            "reviews:1:more": "b",
+            "reviews:10": "c",
+            "reviews:1*": "d",
+            "reviews:1*:more": "e",
+        })
+
+        assert await redis_client.invalidate_namespace("reviews", 1) == 2
+        assert await _keys(redis_client) == ["reviews:1*", "reviews:1*:more", "reviews:10"]
+
+        # 키 일부에 glob 문자가 있어도 다른 키를 지우지 않는다
+        assert await redis_client.invalidate_namespace("reviews", "1*") == 2
+        assert await _keys(redis_client) == ["reviews:10"]
+
+    asyncio.run(scenario())
+
+
+def test_escape_glob():
+    assert escape_glob("a*b?[c]\\") == "a\\*b\\?\\[c\\]\\\\"
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.application.report_application_service import ReportApplicationService
+
+REPORT = {"report_id": 2, "store_id": 1, "total_review_count": 10}
+
+
+@pytest.fixture
+def service(monkeypatch, redis_client):
+    service = ReportApplicationService()
+    service.loads = []
+
+    def load_latest(store_id, include_details):
+        service.loads.append((store_id, include_details))
+        return dict(REPORT, report_id=REPORT["report_id"] + len(service.loads) - 1)
+
+    monkeypatch.setattr(service, "_load_latest", load_latest)
+    monkeypatch.setattr(service, "_find_store_id", lambda name: 1 if name == "가게" else None)
+    return service
+
+
+def test_latest_report_is_cached_per_detail_level(service):
+    async def scenario():
+        return [
+            await service.get_latest_report(store_id=1),
+            await service.get_latest_report(name="가게"),
+            await service.get_latest_report(store_id=1, include_details=True),
+        ]
+
+    summary, by_name, _ = asyncio.run(scenario())
+    assert summary == by_name
+    assert service.loads == [(1, False), (1, True)]
+
+
+def test_invalidate_latest_report_serves_new_report(service):
+    async def scenario():
+        before = await service.get_latest_report(store_id=1)
+        deleted = await service.invalidate_latest_report(1)
+        after = await service.get_latest_report(store_id=1)
+        return before, deleted, after
+
+    before, deleted, after = asyncio.run(scenario())
+    assert deleted == 1
+    assert after["report_id"] == before["report_id"] + 1
+
+
+@pytest.mark.parametrize("kwargs, status_code", [({}, 400), ({"name": "없는 가게"}, 404)])
+def test_latest_report_errors(service, kwargs, status_code):
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(service.get_latest_report(**kwargs))
+    assert e.value.status_code == status_code
@@ -0,0 +1,121 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.models import Review, Store
+from app.services.review_db_service import (
+    decode_cursor,
+    encode_cursor,
+    fetch_stored_reviews,
+    is_revisit,
+    parse_visit_date,
+    review_content_hash,
+)
+
+TODAY = date(2025, 7, 20)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("7.15.화", date(2025, 7, 15)),
+        ("24.12.20.금", date(2024, 12, 20)),
+        # 연도 표기가 없는 미래 날짜는 작년 리뷰
+        ("12.20.금", date(2024, 12, 20)),
+        ("7.20.일", TODAY),
+    ],
+)
+def test_parse_visit_date(text, expected):
+    assert parse_visit_date(text, TODAY) == expected
+
+
+@pytest.mark.parametrize("text", ["", None, "어제", "2.30.목", "13.1.월"])
+def test_parse_visit_date_rejects_unknown_format(text):
+    assert parse_visit_date(text, TODAY) is None
+
+
+def test_content_hash_stable_across_year_notation():
+    # 올해 표기("12.20.금")와 해가 바뀐 뒤 표기("24.12.20.금")가 같은 리뷰로 저장되어야 함
+    review = {"nickname": "nick", "content": "맛있어요"}
+    this_year = parse_visit_date("12.20.금", date(2024, 12, 31))
+    next_year = parse_visit_date("24.12.20.금", date(2025, 1, 2))
+    assert review_content_hash("1", review, this_year) == review_content_hash("1", review, next_year)
+
+
+def test_content_hash_differs_by_place_and_date():
+    review = {"nickname": "nick", "content": "맛있어요"}
+    base = review_content_hash("1", review, date(2025, 7, 15))
+    assert base != review_content_hash("2", review, date(2025, 7, 15))
+    assert base != review_content_hash("1", review, date(2025, 7, 16))
+
+
+def test_is_revisit():
+    assert is_revisit("2번째 방문")
+    assert not is_revisit("1번째 방문")
+    assert not is_revisit("")
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(date(2025, 7, 15), 12345)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (date(2025, 7, 15), 12345)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(date(2025, 7, 15), 1)[:-3]])
+def test_decode_cursor_rejects_invalid(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.fixture
+def session():
+    # fetch_stored_reviews는 표준 SQL만 사용하므로 sqlite 메모리 DB로 검증
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def add_reviews(session, store_id, rows):
+    for review_id, visit_date, revisit in rows:
+        session.add(Review(
+            review_id=review_id,
+            store_id=store_id,
+            content_hash=f"{store_id}-{review_id}",
+            content="내용",
+            visit_date=visit_date,
+            is_revisit=revisit,
+        ))
+    session.flush()
+
+
+def test_fetch_stored_reviews_keyset_pages(session):
+    session.add_all([Store(store_id=1, name="a"), Store(store_id=2, name="b")])
+    add_reviews(session, 1, [
+        (1, date(2025, 7, 1), False),
+        (2, date(2025, 7, 3), True),
+        (3, date(2025, 7, 3), False),
+        (4, date(2025, 7, 2), True),
+        (5, date(2025, 7, 5), False),
+    ])
+    add_reviews(session, 2, [(6, date(2025, 7, 9), False)])
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = fetch_stored_reviews(session, 1, 2, cursor)
+        seen.append([row.review_id for row in rows])
+        if cursor is None:
+            break
+    # (visit_date, review_id) 내림차순, 같은 날짜는 review_id로 이어짐
+    assert seen == [[5, 3], [2, 4], [1]]
+
+    rows, cursor = fetch_stored_reviews(session, 1, 10, revisit_only=True)
+    assert [row.review_id for row in rows] == [2, 4] and cursor is None
+
+
+def test_fetch_stored_reviews_rejects_invalid_cursor(session):
+    with pytest.raises(ValueError):
+        fetch_stored_reviews(session, 1, 10, "not-a-cursor")
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from app.application import review_application_service as review_module
+from app.services.review_dedupe_service import dedupe_reviews, find_near_duplicates, lsh_params
+
+TEMPLATE = "체험단으로 방문했는데 음식이 정말 맛있고 사장님이 친절하셔서 기분 좋게 식사했습니다 강력 추천합니다"
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.8, 0.9])
+@pytest.mark.parametrize("num_perm", [64, 128, 256])
+def test_lsh_params(threshold, num_perm):
+    bands, rows = lsh_params(threshold, num_perm)
+    assert bands * rows == num_perm
+    # 후보 경계는 임계치 이하 (후보는 다시 검증하므로 놓치는 쪽보다 넓게)
+    assert (1 / bands) ** (1 / rows) <= threshold
+
+
+def test_near_duplicates_clustered_to_first():
+    texts = [
+        TEMPLATE,
+        "오늘 점심으로 국밥 먹었는데 국물이 진하고 고기가 부드러워서 좋았어요",
+        TEMPLATE + "!!",
+        TEMPLATE.replace("강력", "완전") + " ^^",
+    ]
+    assert find_near_duplicates(texts).tolist() == [0, 1, 0, 0]
+
+
+def test_short_texts_are_never_duplicates():
+    assert find_near_duplicates(["맛있어요", "맛있어요!", "맛있어요 ^^"]).tolist() == [0, 1, 2]
+
+
+def test_chained_pairs_in_one_bucket():
+    # A~B, B~C는 임계치 이상이지만 A~C는 미만: 대표(A)와만 비교하면 C를 놓침
+    a = "가나다라마바사아자차카타파하" * 2 + "ABCDEFGHIJ"
+    b = "가나다라마바사아자차카타파하" * 2 + "ABCDEFGHIJKLMN"
+    c = "가나다라마바사아자차카타파하" * 2 + "ABCDEFGHIJKLMNOPQR"
+    labels = find_near_duplicates([a, b, c], threshold=0.8)
+    assert labels.tolist() == [0, 0, 0]
+
+
+def test_dedupe_reviews_keeps_first_of_each_cluster():
+    reviews = [{"content": TEMPLATE}, {"content": TEMPLATE + "!"}, {"content": "완전히 다른 내용의 리뷰입니다 분위기 좋아요"}]
+    assert dedupe_reviews(reviews) == [reviews[0], reviews[2]]
+
+
+def test_filter_duplicate_reviews_respects_flag(monkeypatch):
+    reviews = [{"content": TEMPLATE}, {"content": TEMPLATE + "!"}]
+    service = review_module.ReviewApplicationService()
+    assert asyncio.run(service.filter_duplicate_reviews(reviews)) == reviews[:1]
+
+    monkeypatch.setattr(review_module, "REVIEW_DEDUPE_ENABLED", False)
+    assert asyncio.run(service.filter_duplicate_reviews(reviews)) == reviews
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.single_flight import RedisSingleFlight, _LeaderGone
+
+
+def make(lease=30, wait_timeout=5):
+    return RedisSingleFlight("test", lease=lease, result_ttl=60, wait_timeout=wait_timeout)
+
+
+def test_acquire_is_exclusive(redis_client):
+    single_flight = make()
+
+    async def scenario():
+        first = await single_flight.acquire("k")
+        second = await single_flight.acquire("k")
+        await single_flight.complete("k", first, 1)
+        third = await single_flight.acquire("k")
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first and second is None and third
+
+
+def test_renewing_extends_lease(redis_client):
+    single_flight = make(lease=1)
+
+    async def scenario():
+        token = await single_flight.acquire("k")
+        async with single_flight.renewing({"k": token}):
+            await asyncio.sleep(1.5)
+            held = await redis_client.exists(single_flight._lock_key("k"))
+        await asyncio.sleep(1.2)
+        return held, await redis_client.exists(single_flight._lock_key("k"))
+
+    held, after = asyncio.run(scenario())
+    assert held and not after
+
+
+def test_waiter_receives_result(redis_client):
+    single_flight = make()
+
+    async def scenario():
+        token = await single_flight.acquire("k")
+        waiter = asyncio.create_task(single_flight.wait("k"))
+        await asyncio.sleep(0.3)
+        await single_flight.complete("k", token, [{"content": "x"}])
+        return await waiter
+
+    assert asyncio.run(scenario()) == [{"content": "x"}]
+
+
+def test_waiter_receives_error_status(redis_client):
+    single_flight = make()
+
+    async def scenario():
+        token = await single_flight.acquire("k")
+        await single_flight.complete("k", token, error=HTTPException(status_code=503, detail="blocked"))
+        await single_flight.wait("k")
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(scenario())
+    assert e.value.status_code == 503 and e.value.detail == "blocked"
+
+
+def test_waiter_times_out_while_leader_holds_lock(redis_client):
+    single_flight = make(wait_timeout=0.5)
+
+    async def scenario():
+        await single_flight.acquire("k")
+        await single_flight.wait("k")
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(scenario())
+    assert e.value.status_code == 504
+
+
+def test_waiter_detects_leader_gone(redis_client):
+    single_flight = make()
+
+    async def scenario():
+        await single_flight.acquire("k")
+        waiter = asyncio.create_task(single_flight.wait("k"))
+        await asyncio.sleep(0.3)
+        # 결과 없이 락만 사라짐 (리더 프로세스 종료 후 임대 만료)
+        await redis_client.delete(single_flight._lock_key("k"))
+        await waiter
+
+    with pytest.raises(_LeaderGone):
+        asyncio.run(scenario())
+
+
+def test_run_shares_one_execution(redis_client):
+    single_flight = make()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def scenario():
+        return await asyncio.gather(*(single_flight.run("k", work) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["done"] * 3
+    assert len(calls) == 1
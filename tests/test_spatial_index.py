@@ -0,0 +1,65 @@
+import math
+import random
+
+import pytest
+
+from app.utils.spatial_index import COORD_SCALE, GridSpatialIndex, _METERS_PER_DEGREE
+
+CENTER_X, CENTER_Y = int(127.1 * COORD_SCALE), int(37.36 * COORD_SCALE)
+
+
+def brute_force(points, x, y, meters, category=None):
+    per_y = _METERS_PER_DEGREE / COORD_SCALE
+    per_x = per_y * math.cos(math.radians(y / COORD_SCALE))
+    results = []
+    for key, (px, py, cat) in points.items():
+        d = math.hypot((px - x) * per_x, (py - y) * per_y)
+        if d <= meters and (not category or category in cat):
+            results.append((d, key))
+    return sorted(results)
+
+
+@pytest.fixture(scope="module")
+def indexed():
+    rng = random.Random(3)
+    index = GridSpatialIndex(0.005)
+    points = {}
+    for i in range(3000):
+        # 중심 기준 약 ±5km
+        x = CENTER_X + rng.randint(-600_000, 600_000)
+        y = CENTER_Y + rng.randint(-450_000, 450_000)
+        category = rng.choice(["카페", "음식점>한식", "음식점>일식"])
+        points[str(i)] = (x, y, category)
+        index.upsert(str(i), x, y, category, None)
+    return index, points
+
+
+@pytest.mark.parametrize("meters", [50, 300, 1500, 8000])
+@pytest.mark.parametrize("category", [None, "음식점"])
+def test_radius_matches_brute_force(indexed, meters, category):
+    index, points = indexed
+    expected = brute_force(points, CENTER_X, CENTER_Y, meters, category)
+    results = index.radius(CENTER_X, CENTER_Y, meters, category)
+    assert [point.key for _, point in results] == [key for _, key in expected]
+    assert [d for d, _ in results] == pytest.approx([d for d, _ in expected])
+
+
+@pytest.mark.parametrize("meters", [300, 1500, 8000])
+@pytest.mark.parametrize("limit", [1, 10, 50])
+def test_radius_with_limit_returns_nearest(indexed, meters, limit):
+    index, points = indexed
+    expected = brute_force(points, CENTER_X, CENTER_Y, meters)[:limit]
+    results = index.radius(CENTER_X, CENTER_Y, meters, limit=limit)
+    assert [d for d, _ in results] == pytest.approx([d for d, _ in expected])
+
+
+def test_bbox_and_remove():
+    index = GridSpatialIndex(0.005)
+    index.upsert("a", CENTER_X, CENTER_Y, "카페", 1)
+    index.upsert("b", CENTER_X + 100_000, CENTER_Y, "카페", 2)
+    # 같은 키를 다시 넣으면 이동
+    index.upsert("b", CENTER_X + 10_000_000, CENTER_Y, "카페", 2)
+    keys = {p.key for p in index.bbox(CENTER_X - 200_000, CENTER_Y - 200_000, CENTER_X + 200_000, CENTER_Y + 200_000)}
+    assert keys == {"a"}
+    assert index.remove("a") and not index.remove("a")
+    assert len(index) == 1
@@ -0,0 +1,65 @@
+import asyncio
+
+from sqlalchemy.dialects import mysql
+
+from app.application.store_index import StoreIndex
+from app.services.store_index_service import search_item_to_store, store_key, upsert_searched_stores
+
+ITEM = {
+    "title": "<b>국밥</b>집 강남점",
+    "roadAddress": "서울특별시 강남구 테헤란로 1",
+    "category": "한식>국밥",
+    "mapx": "1270276000",
+    "mapy": "374979000",
+}
+
+
+def test_search_item_to_store_normalizes_key():
+    data = search_item_to_store(ITEM)
+    assert data["name"] == "국밥집 강남점"
+    assert data["key"] == store_key("국밥집  강남점", "서울특별시 강남구 테헤란로 1")
+    assert search_item_to_store({**ITEM, "mapx": ""}) is None
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+
+    def scalars(self, stmt):
+        self.statements.append(stmt)
+        return []
+
+
+def test_upsert_is_one_insert_and_one_exact_address_select():
+    session = RecordingSession()
+    data = search_item_to_store(ITEM)
+    upsert_searched_stores(session, [data, dict(data)])
+
+    insert, select = (str(stmt.compile(dialect=mysql.dialect())) for stmt in session.statements)
+    assert "ON DUPLICATE KEY UPDATE" in insert
+    assert insert.count("%s") == 5  # 같은 (상호명, 주소)는 한 행으로
+    assert "(store.name, store.address) IN" in select
+    assert "IS NULL" not in select
+
+
+def test_persist_skips_stores_already_saved(monkeypatch):
+    index = StoreIndex()
+    persisted = []
+
+    def persist(stores):
+        persisted.append([data["key"] for data in stores])
+        return [{**data, "store_id": 1} for data in stores]
+
+    monkeypatch.setattr(index, "_persist", persist)
+
+    async def scenario():
+        index.add_search_items([ITEM])
+        await index.persist_search_items([ITEM])
+        await index.persist_search_items([ITEM])
+
+    asyncio.run(scenario())
+    assert persisted == [[search_item_to_store(ITEM)["key"]]]
+    assert index.nearby(127.0276, 37.4979, 100)[0]["store_id"] == 1
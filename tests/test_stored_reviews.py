@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.application.review_application_service import ReviewApplicationService
+from app.services.crawl_controller import CrawlBlocked
+
+PAGE = {"place_id": "1", "review_count": 1, "reviews": [{"review_id": 1}], "next_cursor": None}
+EMPTY_PAGE = {"place_id": "1", "review_count": 0, "reviews": [], "next_cursor": None}
+
+
+@pytest.fixture
+def service(monkeypatch, redis_client):
+    service = ReviewApplicationService()
+    calls = {"refresh": 0}
+
+    async def refresh_reviews(place_id, store_name=None, more_reviews=5):
+        calls["refresh"] += 1
+        raise CrawlBlocked()
+
+    monkeypatch.setattr(service, "_is_stale", lambda place_id: True)
+    monkeypatch.setattr(service, "refresh_reviews", refresh_reviews)
+    service.calls = calls
+    return service
+
+
+def test_failed_refresh_serves_stored_reviews(service, monkeypatch):
+    monkeypatch.setattr(service, "_load_review_page", lambda *args: PAGE)
+
+    async def scenario():
+        first = await service.get_stored_reviews("1", 20)
+        # 캐싱된 페이지로 응답하여 재수집을 반복하지 않음
+        second = await service.get_stored_reviews("1", 20)
+        return first, second
+
+    assert asyncio.run(scenario()) == (PAGE, PAGE)
+    assert service.calls["refresh"] == 1
+
+
+def test_failed_refresh_without_stored_reviews_raises_crawl_error(service, monkeypatch):
+    monkeypatch.setattr(service, "_load_review_page", lambda *args: None)
+    with pytest.raises(CrawlBlocked):
+        asyncio.run(service.get_stored_reviews("1", 20))
+
+
+def test_empty_first_page_is_not_cached(service, monkeypatch, redis_client):
+    async def refresh_reviews(place_id, store_name=None, more_reviews=5):
+        return 0
+
+    monkeypatch.setattr(service, "refresh_reviews", refresh_reviews)
+    monkeypatch.setattr(service, "_load_review_page", lambda *args: EMPTY_PAGE)
+
+    async def scenario():
+        with pytest.raises(HTTPException) as e:
+            await service.get_stored_reviews("1", 20)
+        client = await redis_client.get_client()
+        return e.value.status_code, [key async for key in client.scan_iter("reviews:*")]
+
+    assert asyncio.run(scenario()) == (404, [])